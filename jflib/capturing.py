@@ -35,6 +35,8 @@ from typing import List, Literal, Union
 
 Stream = Union[Literal["stdout"], Literal["stderr"]]
 
+_ANSI_RE = re.compile(r"\x1b.*?m")
+
 
 class Capturing(List[str]):
     """Capture the stdout or stderr output. This class is designed for unit
@@ -82,4 +84,4 @@ class Capturing(List[str]):
 
     @staticmethod
     def _clean_ansi(text: str) -> str:
-        return re.sub(r"\x1b.*?m", "", text)
+        return _ANSI_RE.sub("", text)
@@ -16,29 +16,35 @@ Module to watch the execution of shell scripts. Both streams (`stdout` and
 from __future__ import annotations
 
 import abc
+import atexit
+import collections
+import fcntl
+import functools
+import itertools
 import logging
 import os
 import pwd
 import queue
+import selectors
 import shlex
 import shutil
 import socket
 import subprocess
 import sys
-import textwrap
 import threading
 import time
 import typing
-import uuid
-from logging.handlers import BufferingHandler
+from logging.handlers import BufferingHandler, QueueListener
 from typing import (
     IO,
     Any,
+    Deque,
     Dict,
     List,
     Literal,
     Optional,
     Sequence,
+    TextIO,
     Tuple,
     TypedDict,
     Union,
@@ -54,6 +60,9 @@ from .send_email import send_email
 HOSTNAME = socket.gethostname()
 USERNAME = pwd.getpwuid(os.getuid()).pw_name
 
+_BODY_PREFIX = f"Host: {HOSTNAME}\nUser: {USERNAME}"
+"""The first lines of :py:attr:`Message.body`, they never change."""
+
 
 Status = Literal[0, 1, 2, 3]
 
@@ -90,29 +99,49 @@ class MessageParams(MinimalMessageParams, total=False):
 
 
 class BaseClass:
-    def _obj_to_str(self, attributes: List[str] = []) -> str:
+    __slots__ = ()
+
+    _STR_ATTRS: Optional[Tuple[str, ...]] = None
+    """The public, non-callable attributes shown by :meth:`_obj_to_str`.
+    Computed once per class on first use, unless declared explicitly."""
+
+    def _str_attrs(self) -> Tuple[str, ...]:
+        cls = type(self)
+        attributes = cls.__dict__.get("_STR_ATTRS")
+        if attributes is None:
+            attributes = tuple(
+                attribute
+                for attribute in dir(self)
+                if not attribute.startswith("_")
+                and not callable(getattr(self, attribute))
+            )
+            cls._STR_ATTRS = attributes
+        return attributes
+
+    def _obj_to_str(self, attributes: Sequence[str] = ()) -> str:
         if not attributes:
-            attributes = dir(self)
+            attributes = self._str_attrs()
         output: List[str] = []
         for attribute in attributes:
-            if not attribute.startswith("_") and not callable(getattr(self, attribute)):
-                value = getattr(self, attribute)
-                if value:
-                    value = textwrap.shorten(str(value), width=64)
-                    value = value.replace("\n", " ")
-                    output.append("{}: '{}'".format(attribute, value))
-        return "[{}] {}".format(self.__class__.__name__, ", ".join(output))
+            value = getattr(self, attribute)
+            if value:
+                value = str(value).replace("\n", " ")
+                if len(value) > 64:
+                    value = value[:63] + "…"
+                output.append(f"{attribute}: '{value}'")
+        return f"[{self.__class__.__name__}] {', '.join(output)}"
 
 
 class CommandWatcherError(Exception):
     """Exception raised by this module."""
 
     def __init__(self, msg: str, **data: Unpack[MessageParams]):
-        reporter.report(
-            status=2,
-            custom_message="{}: {}".format(self.__class__.__name__, msg),
-            **data,  # type: ignore
-        )
+        if reporter.channels:
+            reporter.report(
+                status=2,
+                custom_message="{}: {}".format(self.__class__.__name__, msg),
+                **data,  # type: ignore
+            )
 
 
 class Timer:
@@ -136,7 +165,7 @@ class Timer:
         :rtype: str"""
         self.stop = time.time()
         self.interval = self.stop - self.start
-        return "{:.3f}s".format(self.interval)
+        return f"{self.interval:.3f}s"
 
 
 # Logging #####################################################################
@@ -158,113 +187,391 @@ LOGFMT = "%(asctime)s_%(msecs)03d %(levelname)s %(message)s"
 DATEFMT = "%Y%m%d_%H%M%S"
 
 
+class _LevelStyle(typing.NamedTuple):
+    label: str
+    """The colorized and padded level name."""
+
+    start: str
+    """The escape sequence which opens the message."""
+
+    end: str
+    """The escape sequence which closes the message."""
+
+    stderr: bool
+    """Whether the record is printed on `stderr`."""
+
+    plain_label: str
+    """The padded level name without any escape sequences."""
+
+
+def _level_style(
+    levelno: int, level: str, color: str, attr: Optional[str] = None
+) -> _LevelStyle:
+    """Assemble the ANSI escape sequences to print a record of a log level.
+
+    :param levelno: The number of the log level.
+    :param level: The name of the log level.
+    :param color: A color name of the module :py:mod:`termcolor`.
+    :param attr: An additional attribute like `bold` or `dark`.
+
+    """
+    if attr:
+        reverse = ["reverse", attr]
+        normal = [attr]
+    else:
+        reverse = ["reverse"]
+        normal = []
+    label = termcolor.colored(f" {level:<8} ", color, attrs=reverse)
+    open_ = termcolor.colored("", color, attrs=normal)
+    close = ""
+    if open_.endswith(termcolor.RESET):
+        open_ = open_[: -len(termcolor.RESET)]
+        close = termcolor.RESET
+    return _LevelStyle(label, open_, close, levelno >= STDERR, f"{level:<8}")
+
+
+# CRITICAL 50
+# ERROR 40
+# -> STDERR 35
+# WARNING 30
+# INFO 20
+# DEBUG 10
+# --> STDOUT 5
+# NOTSET 0
+_LEVEL_STYLES: Dict[int, _LevelStyle] = {
+    logging.CRITICAL: _level_style(logging.CRITICAL, "CRITICAL", "red", "bold"),
+    logging.ERROR: _level_style(logging.ERROR, "ERROR", "red"),
+    STDERR: _level_style(STDERR, "STDERR", "red", "dark"),
+    logging.WARNING: _level_style(logging.WARNING, "WARNING", "yellow"),
+    logging.INFO: _level_style(logging.INFO, "INFO", "green"),
+    logging.DEBUG: _level_style(logging.DEBUG, "DEBUG", "white"),
+    STDOUT: _level_style(STDOUT, "STDOUT", "white", "dark"),
+    logging.NOTSET: _level_style(logging.NOTSET, "NOTSET", "grey"),
+}
+"""The precomputed escape sequences of the log levels. The styles of the
+known levels are assembled at import time, the styles of custom levels on
+their first use."""
+
+
+class _ConsolePrinter(logging.Handler):
+    """Print the records the console :py:class:`QueueListener` takes from
+    the queue. The queue items are pairs of a function and its argument, for
+    example the print method of a :py:class:`LoggingHandler` and a record."""
+
+    def emit(self, record: Any):
+        function, argument = record
+        try:
+            function(argument)
+        except Exception:
+            # An exception would end the listener thread shared by all
+            # handlers.
+            self.handleError(argument)
+
+
+_console_queue: "queue.SimpleQueue[Tuple[typing.Callable[[Any], Any], Any]]" = (
+    queue.SimpleQueue()
+)
+"""The queue of the console listener thread, shared by all handlers."""
+
+_console_listener: Optional[QueueListener] = None
+"""The console listener thread, started on its first use."""
+
+_console_listener_lock = threading.Lock()
+
+
+def _start_console_listener() -> None:
+    """Start the console listener thread unless it is already running."""
+    global _console_listener
+    with _console_listener_lock:
+        if _console_listener is None:
+            _console_listener = QueueListener(_console_queue, _ConsolePrinter())
+            _console_listener.start()
+
+
+def _stop_console_listener() -> None:
+    """Stop the console listener thread after all pending records are
+    printed."""
+    global _console_listener
+    with _console_listener_lock:
+        if _console_listener is not None:
+            _console_listener.stop()
+            _console_listener = None
+
+
+atexit.register(_stop_console_listener)
+
+
+def _wait_console_listener() -> None:
+    """Wait until the console listener thread has printed all records
+    enqueued so far."""
+    listener = _console_listener
+    if listener is None:
+        return
+    thread: Optional[threading.Thread] = listener._thread  # type: ignore
+    done = threading.Event()
+    _console_queue.put((threading.Event.set, done))
+    # Don’t wait forever for a listener thread that has ended.
+    while not done.wait(0.1):
+        if thread is None or not thread.is_alive():
+            return
+
+
 class LoggingHandler(BufferingHandler):
-    """Store of all logging records in the memory. Print all records on emit."""
+    """Store of all logging records in the memory. Print all records on emit.
+
+    The records are stored in a ring buffer: If more than `capacity` records
+    are emitted, the oldest ones are discarded.
+
+    :param master_logger: Forward all log messages to a master logger.
+    :param queue_console: Print the records in a separate listener thread.
+      `emit` only enqueues the records to print, the colorizing and the
+      terminal output is done by a :py:class:`QueueListener`. All handlers
+      share one listener thread, which is stopped at the exit of the
+      interpreter. Call `close` to wait until all pending records of the
+      handler are printed.
+    :param capacity: The maximum number of records kept in the memory.
+    :param colorize: Print the records with ANSI colors. By default the
+      records are only colorized if `stdout` is a terminal.
+    """
+
+    buffer: Deque[logging.LogRecord]  # type: ignore
 
     _master_logger: Optional[logging.Logger]
 
-    def __init__(self, master_logger: Optional[logging.Logger] = None):
-        BufferingHandler.__init__(self, capacity=1000000)
-        self._master_logger = master_logger
+    _queue_console: bool
 
-    @staticmethod
-    def _print(record: logging.LogRecord):
-        """
-        :param logging.LogRecord record: A record object.
-        """
-        level = record.levelname
-        # CRITICAL 50
-        # ERROR 40
-        # -> STDERR 35
-        # WARNING 30
-        # INFO 20
-        # DEBUG 10
-        # --> STDOUT 5
-        # NOTSET 0
-        attr = None
-        if level == "CRITICAL":
-            color = "red"
-            attr = "bold"
-        elif level == "ERROR":
-            color = "red"
-        elif level == "STDERR":
-            color = "red"
-            attr = "dark"
-        elif level == "WARNING":
-            color = "yellow"
-        elif level == "INFO":
-            color = "green"
-        elif level == "DEBUG":
-            color = "white"
-        elif level == "STDOUT":
-            color = "white"
-            attr = "dark"
-        elif level == "NOTSET":
-            color = "grey"
-        else:
-            color = "grey"
+    console_level: int
+    """Only records with this level or higher are printed on the console. All
+    records are stored in the buffer regardless of this threshold."""
 
-        if attr:
-            reverse = ["reverse", attr]
-            normal = [attr]
-        else:
-            reverse = ["reverse"]
-            normal = []
+    colorize: bool
+    """Print the records with ANSI colors."""
 
-        if record.levelno >= STDERR:
-            stream = sys.stderr
-        else:
-            stream = sys.stdout
+    console_batch_size: int
+    """Collect this many console lines before writing them at once. Records
+    with the level `ERROR` or higher are written immediately together with
+    all pending lines. Call `flush_console` to write the pending lines."""
 
-        created = "{}_{:03d}".format(
-            time.strftime(DATEFMT, time.localtime(record.created)),
-            int(record.msecs),
-        )
+    console_flush_interval: float
+    """Write the pending console lines as soon as the oldest one is this many
+    seconds old (checked on each new record)."""
 
-        print(
-            "{} {} {}".format(
-                created,
-                termcolor.colored(" {:<8} ".format(level), color, attrs=reverse),
-                termcolor.colored(record.msg, color, attrs=normal),
-            ),
-            file=stream,
-        )
+    _console_pending: List[Tuple[TextIO, str]]
+    """Console lines waiting to be written and their output streams."""
+
+    _console_pending_since: float
+    """The creation time of the oldest pending console line."""
+
+    _timestamp: Tuple[int, str] = (0, "")
+    """A second (UNIX timestamp) and its formatted timestamp string. Shared
+    by all handlers, because each process gets a new handler. The tuple is
+    replaced as a whole, so that the console listener threads always see a
+    consistent pair."""
+
+    _stdout_msgs: Deque[str]
+    _stderr_msgs: Deque[str]
+
+    _n_stdout: int
+    """The number of `stdout` lines, including the lines already discarded by
+    the ring buffer."""
+
+    _n_stderr: int
+    """The number of `stderr` lines, including the lines already discarded by
+    the ring buffer."""
+
+    _all_formatted: Deque[str]
+    """All records formatted by the formatter of the handler."""
+
+    _stdout_joined: Optional[str]
+    """Cached result of the property `stdout`, `None` if outdated."""
+
+    _stderr_joined: Optional[str]
+    """Cached result of the property `stderr`, `None` if outdated."""
+
+    _all_joined: Optional[str]
+    """Cached result of the property `all_records`, `None` if outdated."""
+
+    def __init__(
+        self,
+        master_logger: Optional[logging.Logger] = None,
+        queue_console: bool = False,
+        capacity: int = 1000000,
+        colorize: Optional[bool] = None,
+    ):
+        BufferingHandler.__init__(self, capacity=capacity)
+        self.buffer = collections.deque(maxlen=capacity)
+        self._master_logger = master_logger
+        self._queue_console = queue_console
+        if queue_console:
+            _start_console_listener()
+        self.console_level = logging.NOTSET
+        if colorize is None:
+            colorize = sys.stdout.isatty()
+        self.colorize = colorize
+        self.console_batch_size = 1
+        self.console_flush_interval = 1.0
+        self._console_pending = []
+        self._console_pending_since = 0.0
+        self._stdout_msgs = collections.deque(maxlen=capacity)
+        self._stderr_msgs = collections.deque(maxlen=capacity)
+        self._n_stdout = 0
+        self._n_stderr = 0
+        self._all_formatted = collections.deque(maxlen=capacity)
+        self._stdout_joined = None
+        self._stderr_joined = None
+        self._all_joined = None
+
+    def _print(self, record: logging.LogRecord):
+        """
+        :param logging.LogRecord record: A record object.
+        """
+        style = _LEVEL_STYLES.get(record.levelno)
+        if style is None:
+            # A custom log level: assemble its style only once.
+            style = _level_style(record.levelno, record.levelname, "grey")
+            _LEVEL_STYLES[record.levelno] = style
+        label, open_, close, to_stderr, plain_label = style
+        # The streams are looked up for each record: they may be replaced,
+        # for example to capture the output.
+        stream = sys.stderr if to_stderr else sys.stdout
+
+        sec = int(record.created)
+        cached_sec, timestamp = LoggingHandler._timestamp
+        if sec != cached_sec:
+            timestamp = time.strftime(DATEFMT, time.localtime(sec))
+            LoggingHandler._timestamp = (sec, timestamp)
+        created = f"{timestamp}_{int(record.msecs):03d}"
+
+        # One write call per record: print() would write the line and the
+        # line break separately.
+        msg = record.getMessage()
+        if self.colorize:
+            line = f"{created} {label} {open_}{msg}{close}\n"
+        else:
+            line = f"{created} {plain_label} {msg}\n"
+        if self.console_batch_size <= 1:
+            stream.write(line)
+            return
+        # The listener thread appends while the main thread may flush.
+        with self.lock:  # type: ignore
+            if not self._console_pending:
+                self._console_pending_since = record.created
+            self._console_pending.append((stream, line))
+            if (
+                len(self._console_pending) >= self.console_batch_size
+                or record.levelno >= logging.ERROR
+                or record.created - self._console_pending_since
+                >= self.console_flush_interval
+            ):
+                self._write_pending()
+
+    def flush_console(self):
+        """Write all pending console lines. With `queue_console` wait until
+        the listener thread has printed all records enqueued so far."""
+        if self._queue_console:
+            _wait_console_listener()
+        self._write_pending()
+
+    def _write_pending(self):
+        """Write the pending console lines. Consecutive lines of the same
+        stream are joined and written with one call."""
+        with self.lock:  # type: ignore
+            pending, self._console_pending = self._console_pending, []
+            for stream, group in itertools.groupby(pending, key=lambda i: i[0]):
+                stream.write("".join(line for _, line in group))
 
     def emit(self, record: logging.LogRecord):
         """
         :param record: A record object.
         """
         self.buffer.append(record)
+        self._all_formatted.append(self.format(record))
+        self._all_joined = None
+        msg = record.getMessage()
+        if record.levelno == STDOUT:
+            self._stdout_msgs.append(msg)
+            self._n_stdout += 1
+            self._stdout_joined = None
+        elif record.levelno == STDERR:
+            self._stderr_msgs.append(msg)
+            self._n_stderr += 1
+            self._stderr_joined = None
         if not self._master_logger:
-            self._print(record)
-        else:
-            self._master_logger.log(record.levelno, record.msg)
-        if self.shouldFlush(record):
-            self.flush()
+            if record.levelno >= self.console_level:
+                if self._queue_console:
+                    _console_queue.put((self._print, record))
+                else:
+                    self._print(record)
+        elif self._master_logger.isEnabledFor(record.levelno):
+            # Pass the record on as it is: `Logger.log` would create a new
+            # record and look up the caller.
+            self._master_logger.handle(record)
+
+    def close(self):
+        """Wait until all pending records are printed. Records emitted after
+        closing are printed directly."""
+        self.flush_console()
+        self._queue_console = False
+        BufferingHandler.close(self)
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        """Never flush automatically, the ring buffer discards the oldest
+        records instead."""
+        return False
+
+    def flush(self):
+        """Clear the buffer and all data derived from it."""
+        with self.lock:  # type: ignore
+            self.buffer.clear()
+            self._stdout_msgs.clear()
+            self._stderr_msgs.clear()
+            self._n_stdout = 0
+            self._n_stderr = 0
+            self._all_formatted.clear()
+            self._stdout_joined = None
+            self._stderr_joined = None
+            self._all_joined = None
 
     @property
-    def stdout(self):
-        messages: List[str] = []
-        for record in self.buffer:
-            if record.levelname == "STDOUT":
-                messages.append(record.msg)
-        return "\n".join(messages)
+    def stdout(self) -> str:
+        """All `stdout` messages joined by line breaks."""
+        if self._stdout_joined is None:
+            self._stdout_joined = "\n".join(self._stdout_msgs)
+        return self._stdout_joined
 
     @property
-    def stderr(self):
-        messages: List[str] = []
-        for record in self.buffer:
-            if record.levelname == "STDERR":
-                messages.append(record.msg)
-        return "\n".join(messages)
+    def stdout_lines(self) -> Tuple[str, ...]:
+        """All `stdout` messages as a tuple of lines."""
+        return tuple(self._stdout_msgs)
+
+    @property
+    def stdout_line_count(self) -> int:
+        """The number of `stdout` messages."""
+        return self._n_stdout
+
+    @property
+    def stderr(self) -> str:
+        """All `stderr` messages joined by line breaks."""
+        if self._stderr_joined is None:
+            self._stderr_joined = "\n".join(self._stderr_msgs)
+        return self._stderr_joined
 
     @property
-    def all_records(self):
+    def stderr_lines(self) -> Tuple[str, ...]:
+        """All `stderr` messages as a tuple of lines."""
+        return tuple(self._stderr_msgs)
+
+    @property
+    def stderr_line_count(self) -> int:
+        """The number of `stderr` messages."""
+        return self._n_stderr
+
+    @property
+    def all_records(self) -> str:
         """All log messages joined by line breaks."""
-        messages: List[str] = []
-        for record in self.buffer:
-            messages.append(self.format(record))
-        return "\n".join(messages)
+        if self._all_joined is None:
+            self._all_joined = "\n".join(self._all_formatted)
+        return self._all_joined
 
 
 class ExtendedLogger(logging.Logger):
@@ -276,33 +583,60 @@ class ExtendedLogger(logging.Logger):
 
 
 def _log_stdout(self: ExtendedLogger, message: object, *args: Any, **kws: Any):
-    # Yes, logger takes its '*args' as 'args'.
-    self._log(STDOUT, message, args, **kws)
+    if self.isEnabledFor(STDOUT):
+        # Yes, logger takes its '*args' as 'args'.
+        self._log(STDOUT, message, args, **kws)
+
+
+def _log_stderr(self: ExtendedLogger, message: object, *args: Any, **kws: Any):
+    if self.isEnabledFor(STDERR):
+        # Yes, logger takes its '*args' as 'args'.
+        self._log(STDERR, message, args, **kws)
 
 
 extendedLogger: ExtendedLogger = cast(ExtendedLogger, logging.Logger)
 
+# Patch the logger class only once, at the import of this module.
+logging.Logger.stdout = _log_stdout  # type: ignore
+logging.Logger.stderr = _log_stderr  # type: ignore
 
-extendedLogger.stdout = _log_stdout  # type: ignore
 
+_logger_ids = itertools.count()
+"""Numbers the loggers created by :py:func:`setup_logging`."""
 
-def _log_stderr(self: ExtendedLogger, message: object, *args: Any, **kws: Any):
-    # Yes, logger takes its '*args' as 'args'.
-    self._log(STDERR, message, args, **kws)
 
+class _UnregisteredLogger(logging.Logger):
+    """A logger outside of the logging manager. The manager only clears the
+    level caches of the registered loggers (on `setLevel` or
+    `logging.disable`), so this logger doesn’t use a cache."""
 
-logging.Logger.stderr = _log_stderr  # type: ignore
+    def isEnabledFor(self, level: int) -> bool:
+        if self.disabled or self.manager.disable >= level:
+            return False
+        return level >= self.getEffectiveLevel()
 
 
 def setup_logging(
     master_logger: Optional[logging.Logger] = None,
+    queue_console: bool = False,
+    colorize: Optional[bool] = None,
 ) -> typing.Tuple[ExtendedLogger, LoggingHandler]:
     """Setup a fresh logger for each watch action.
 
-    :param master_logger: Forward all log messages to a master logger."""
-    logger = logging.getLogger(name=str(uuid.uuid1()))
+    :param master_logger: Forward all log messages to a master logger.
+    :param queue_console: Print the log records in a separate listener
+      thread (see :py:class:`LoggingHandler`).
+    :param colorize: Print the log records with ANSI colors. By default
+      only if `stdout` is a terminal."""
+    # The logger is not registered in the logging manager: each process gets
+    # its own logger, which would otherwise stay in the manager for the
+    # lifetime of the program.
+    logger = _UnregisteredLogger(name=f"cwatch.{next(_logger_ids)}")
+    logger.parent = logging.root
     formatter = logging.Formatter(fmt=LOGFMT, datefmt=DATEFMT)
-    handler = LoggingHandler(master_logger=master_logger)
+    handler = LoggingHandler(
+        master_logger=master_logger, queue_console=queue_console, colorize=colorize
+    )
     handler.setFormatter(formatter)
     # Show all log messages: use 1 instead of 0: because:
     # From the documentation:
@@ -322,56 +656,94 @@ class Message(BaseClass):
     """
     This message class bundles all available message data into an object. The
     different reporters can choose which data they use.
+
+    The message is immutable: The composed texts are built on first access
+    and then cached.
     """
 
-    _data: MessageParams
+    __slots__ = (
+        "status",
+        "service_name",
+        "custom_message",
+        "prefix",
+        "_body",
+        "_performance_data",
+        "_log_records",
+        "_processes",
+        # Storage for the cached properties.
+        "__dict__",
+    )
+
+    status: int
+    """0 (OK), 1 (WARNING), 2 (CRITICAL), 3 (UNKOWN): see
+    Nagios / Icinga monitoring status / state."""
+
+    service_name: str
+
+    custom_message: str
+
+    prefix: str
+
+    _body: str
+
+    _performance_data: Optional[Dict[str, Any]]
+
+    _log_records: str
+
+    _processes: Optional[List[Process]]
+
+    _STR_ATTRS = (
+        "body",
+        "custom_message",
+        "message",
+        "message_monitoring",
+        "performance_data",
+        "prefix",
+        "processes",
+        "service_name",
+        "status",
+        "status_text",
+        "user",
+    )
 
     def __init__(self, **data: Unpack[MessageParams]):
-        self._data = data
+        self.status = data.get("status", 0)
+        self.service_name = data.get("service_name", "service_not_set")
+        self.custom_message = data.get("custom_message", "")
+        self.prefix = data.get("prefix", "[cwatcher]:")
+        self._body = data.get("body", "")
+        self._performance_data = data.get("performance_data")
+        self._log_records = data.get("log_records", "")
+        self._processes = data.get("processes")
 
     def __str__(self):
         return self._obj_to_str()
 
-    @property
-    def status(self) -> int:
-        """0 (OK), 1 (WARNING), 2 (CRITICAL), 3 (UNKOWN): see
-        Nagios / Icinga monitoring status / state."""
-        return self._data.get("status", 0)
-
     @property
     def status_text(self) -> str:
-        """The status as a text word like `OK`."""
-        return icinga.States[self.status]
-
-    @property
-    def service_name(self) -> str:
-        return self._data.get("service_name", "service_not_set")
+        """The status as a text word like `OK`. Unknown status numbers
+        result in `UNKNOWN`."""
+        if 0 <= self.status < len(icinga.States):
+            return icinga.States[self.status]
+        return icinga.States[icinga.STATE_UNKNOWN]
 
-    @property
+    @functools.cached_property
     def performance_data(self) -> str:
         """
         :return: A concatenated string
         :rtype: str
         """
-        performance_data = self._data.get("performance_data")
+        performance_data = self._performance_data
         if performance_data and isinstance(performance_data, dict):
             pairs: List[str] = []
             key: str
             value: Any
             for key, value in performance_data.items():
-                pairs.append("{!s}={!s}".format(key, value))
+                pairs.append(f"{key!s}={value!s}")
             return " ".join(pairs)
         return ""
 
-    @property
-    def custom_message(self) -> str:
-        return self._data.get("custom_message", "")
-
-    @property
-    def prefix(self) -> str:
-        return self._data.get("prefix", "[cwatcher]:")
-
-    @property
+    @functools.cached_property
     def message(self) -> str:
         output: List[str] = []
         if self.prefix:
@@ -380,10 +752,10 @@ class Message(BaseClass):
         output.append(self.service_name.upper())
         output.append(self.status_text)
         if self.custom_message:
-            output.append("- {}".format(self.custom_message))
+            output.append(f"- {self.custom_message}")
         return " ".join(output)
 
-    @property
+    @functools.cached_property
     def message_monitoring(self) -> str:
         """message + performance_data"""
         output: List[str] = []
@@ -393,23 +765,21 @@ class Message(BaseClass):
             output.append(self.performance_data)
         return " ".join(output)
 
-    @property
+    @functools.cached_property
     def body(self) -> str:
         """Text body for the e-mail message."""
         output: List[str] = []
-        output.append("Host: {}".format(HOSTNAME))
-        output.append("User: {}".format(USERNAME))
-        output.append("Service name: {}".format(self.service_name))
+        output.append(_BODY_PREFIX)
+        output.append(f"Service name: {self.service_name}")
 
         if self.performance_data:
-            output.append("Performance data: {}".format(self.performance_data))
+            output.append(f"Performance data: {self.performance_data}")
 
-        body: str = self._data.get("body", "")
-        if body:
+        if self._body:
             output.append("")
-            output.append(body)
+            output.append(self._body)
 
-        log_records = self._data.get("log_records", "")
+        log_records = self._log_records
         if log_records:
             output.append("")
             output.append("Log records:")
@@ -418,19 +788,19 @@ class Message(BaseClass):
 
         return "\n".join(output)
 
-    @property
+    @functools.cached_property
     def processes(self) -> Optional[str]:
         output: List[str] = []
-        processes = self._data.get("processes")
+        processes = self._processes
         if processes:
             for process in processes:
                 output.append(" ".join(process.args_normalized))
         if output:
-            return "({})".format("; ".join(output))
+            return f"({'; '.join(output)})"
 
     @property
     def user(self) -> str:
-        return "[user:{}]".format(USERNAME)
+        return f"[user:{USERNAME}]"
 
 
 class BaseChannel(BaseClass, metaclass=abc.ABCMeta):
@@ -669,6 +1039,51 @@ CONFIG_READER_SPEC: Spec = {
 Args = Union[str, List[str], Tuple[str]]
 
 
+PIPE_SIZE = 1 << 20
+"""The requested kernel buffer size of the `stdout` and `stderr` pipes
+(1 MiB)."""
+
+READ_SIZE = 1 << 16
+"""The maximum number of bytes read from a pipe with one system call
+(64 KiB)."""
+
+
+def _enlarge_pipe(pipe: Optional[IO[bytes]]) -> None:
+    """Request a larger kernel buffer for a pipe so that a chatty process
+    is less often blocked by a full pipe. Only supported on Linux, silently
+    ignored elsewhere or if the request exceeds the system limit."""
+    if pipe is None or not hasattr(fcntl, "F_SETPIPE_SZ"):
+        return
+    try:
+        fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, PIPE_SIZE)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=128)
+def _split(args: str) -> Tuple[str, ...]:
+    """Split a command line like a shell. Commands are often run many times,
+    so the results of the slow :py:func:`shlex.split` are cached."""
+    return tuple(shlex.split(args))
+
+
+def _drain(fd: int, buffer: bytearray) -> bool:
+    """Read at most :py:data:`READ_SIZE` bytes from a non-blocking file
+    descriptor and append them to `buffer`. Only one read per call: a fast
+    writer could otherwise keep the loop going, the buffer would grow
+    without bounds and no line would be logged in the meantime.
+
+    :return: True if the end of the file is reached."""
+    try:
+        chunk = os.read(fd, READ_SIZE)
+    except BlockingIOError:
+        return False
+    if not chunk:
+        return True
+    buffer += chunk
+    return False
+
+
 class ProcessArgs(TypedDict, total=False):
     shell: bool
     """If true, the command will be executed through the
@@ -696,8 +1111,6 @@ class Process:
     args: Args
     """Process arguments in various types."""
 
-    _queue: "queue.Queue[Optional[Tuple[bytes, capturing.Stream]]]"
-
     log: ExtendedLogger
     """A ready to go and configured logger."""
 
@@ -705,6 +1118,8 @@ class Process:
 
     subprocess: subprocess.Popen[Any]
 
+    _args_normalized: List[str]
+
     def __init__(
         self,
         args: Args,
@@ -713,48 +1128,36 @@ class Process:
     ):
         # self.args: typing.Union[str, list, tuple] = args
         self.args = args
-
-        self._queue = queue.Queue()
+        self._args_normalized = list(_split(args) if isinstance(args, str) else args)
 
         log, log_handler = setup_logging(master_logger=master_logger)
         self.log = log
         self.log_handler = log_handler
 
-        self.log.info("Run command: {}".format(" ".join(self.args_normalized)))
+        self.log.info(f"Run command: {' '.join(self._args_normalized)}")
         timer = Timer()
         self.subprocess = subprocess.Popen(
-            self.args_normalized,
+            self._args_normalized,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            # RuntimeWarning: line buffering (buffering=1) isn't
-            # supported in binary mode, the default buffer size will be used
-            # bufsize=1,
+            # Unbuffered: The pipes are read with os.read() in large chunks,
+            # a BufferedReader around them would never be used.
+            bufsize=0,
             **kwargs,
         )
 
-        self._start_thread(self.subprocess.stdout, "stdout")
-        self._start_thread(self.subprocess.stderr, "stderr")
+        _enlarge_pipe(self.subprocess.stdout)
+        _enlarge_pipe(self.subprocess.stderr)
 
-        for _ in range(2):
-            for line, stream in iter(self._queue.get, None):
-                if line:
-                    line = line.decode("utf-8").strip()
-
-                if line:
-                    if stream == "stderr":
-                        self.log.stderr(line)
-                    if stream == "stdout":
-                        self.log.stdout(line)
+        self._read_pipes()
         self.subprocess.wait()
-        self.log.info("Execution time: {}".format(timer.result()))
+        self.log_handler.flush_console()
+        self.log.info(f"Execution time: {timer.result()}")
 
     @property
     def args_normalized(self) -> Sequence[str]:
         """Normalized `args`, always a list"""
-        if isinstance(self.args, str):
-            return shlex.split(self.args)
-        else:
-            return self.args
+        return self._args_normalized
 
     @property
     def stdout(self) -> str:
@@ -763,8 +1166,8 @@ class Process:
 
     @property
     def line_count_stdout(self) -> int:
-        """The count of lines of the current `stderr`."""
-        return len(self.stdout.splitlines())
+        """The count of lines of the current `stdout`."""
+        return self.log_handler.stdout_line_count
 
     @property
     def stderr(self) -> str:
@@ -774,24 +1177,61 @@ class Process:
     @property
     def line_count_stderr(self) -> int:
         """The count of lines of the current `stderr`."""
-        return len(self.stderr.splitlines())
-
-    def _stdout_stderr_reader(self, pipe: IO[bytes], stream: capturing.Stream):
-        """
-        :param object pipe: `process.stdout` or `process.stdout`
-        """
-        try:
-            with pipe:
-                for line in iter(pipe.readline, b""):
-                    self._queue.put((line, stream))
-        finally:
-            self._queue.put(None)
+        return self.log_handler.stderr_line_count
+
+    def _log_line(self, line: str, stream: capturing.Stream):
+        text = line.strip()
+        if not text:
+            return
+        level = STDERR if stream == "stderr" else STDOUT
+        if self.log.isEnabledFor(level):
+            # Build the record directly, without the caller lookup of
+            # `Logger._log`. `Logger.handle` still passes it to the handler
+            # and propagates it to the handlers of the root logger.
+            self.log.handle(
+                logging.LogRecord(self.log.name, level, "", 0, text, (), None)
+            )
 
-    def _start_thread(self, pipe: Optional[IO[str]], stream: capturing.Stream):
-        """
-        :param object pipe: `process.stdout` or `process.stdout`
-        """
-        threading.Thread(target=self._stdout_stderr_reader, args=[pipe, stream]).start()
+    def _read_pipes(self):
+        """Read `stdout` and `stderr` of the subprocess in the current thread
+        until both pipes are closed. Both pipes are non-blocking and
+        multiplexed by a selector, the output is read in chunks of
+        :py:data:`READ_SIZE` bytes.
+
+        The chunks are collected in a `bytearray` per stream. All complete
+        lines are decoded at once, only the trailing incomplete line stays in
+        the buffer."""
+        selector = selectors.DefaultSelector()
+        residuals: Dict[capturing.Stream, bytearray] = {}
+        pipes: Tuple[Tuple[Optional[IO[bytes]], capturing.Stream], ...] = (
+            (self.subprocess.stdout, "stdout"),
+            (self.subprocess.stderr, "stderr"),
+        )
+        for pipe, stream in pipes:
+            if pipe is None:
+                continue
+            os.set_blocking(pipe.fileno(), False)
+            selector.register(pipe, selectors.EVENT_READ, stream)
+            residuals[stream] = bytearray()
+
+        with selector:
+            while selector.get_map():
+                for key, _ in selector.select():
+                    stream = key.data
+                    residual = residuals[stream]
+                    if _drain(key.fd, residual):
+                        selector.unregister(key.fileobj)
+                        key.fileobj.close()
+                        text = residual.decode("utf-8", "replace")
+                        residual.clear()
+                    else:
+                        end = residual.rfind(b"\n")
+                        if end < 0:
+                            continue
+                        text = residual[:end].decode("utf-8", "replace")
+                        del residual[: end + 1]
+                    for line in text.split("\n"):
+                        self._log_line(line, stream)
 
 
 class Watch:
@@ -805,6 +1245,12 @@ class Watch:
       non-zero exit code.
     :param config_reader: A custom configuration reader. Specify this
       parameter to not use the build in configuration reader.
+    :param queue_console: Print the log records in a separate listener
+      thread, so that the terminal output doesn’t slow down the capturing of
+      the process output.
+    :param console_batch_size: Write the console output in batches of this
+      many lines (see :py:attr:`LoggingHandler.console_batch_size`). The
+      pending lines are written at the latest when a command has finished.
     """
 
     _hostname: str
@@ -837,17 +1283,20 @@ class Watch:
         raise_exceptions: bool = True,
         config_reader: Optional[ConfigReader] = None,
         report_channels: Optional[List[BaseChannel]] = None,
+        queue_console: bool = False,
+        console_batch_size: int = 1,
     ):
         self._hostname = HOSTNAME
 
         self._service_name = service_name
 
-        log, log_handler = setup_logging()
+        log, log_handler = setup_logging(queue_console=queue_console)
 
         self.log = log
         self.log.info("Hostname: {}".format(self._hostname))
 
         self._log_handler = log_handler
+        self._log_handler.console_batch_size = console_batch_size
 
         self._conf = None
 
@@ -911,6 +1360,22 @@ class Watch:
         """Alias / shortcut for `self._log_handler.stdout`."""
         return self._log_handler.stdout
 
+    def _log_line(self, level: int, line: str) -> None:
+        if self.log.isEnabledFor(level):
+            # Build the record directly, bypassing `Logger._log` and
+            # `makeRecord`, as in :py:meth:`Process._log_line`.
+            self.log.handle(
+                logging.LogRecord(self.log.name, level, "", 0, line, (), None)
+            )
+
+    def log_stdout(self, line: str) -> None:
+        """A faster alternative to `self.log.stdout(line)`."""
+        self._log_line(STDOUT, line)
+
+    def log_stderr(self, line: str) -> None:
+        """A faster alternative to `self.log.stderr(line)`."""
+        self._log_line(STDERR, line)
+
     @property
     def stderr(self):
         """Alias / shortcut for `self._log_handler.stderr`."""
@@ -939,15 +1404,20 @@ class Watch:
         else:
             master_logger = None
         process = Process(args, master_logger=master_logger, **kwargs)
+        self._log_handler.flush_console()
         self.processes.append(process)
         rc = process.subprocess.returncode
         if self._raise_exceptions and rc != 0 and rc not in ignore_exceptions:
+            data: MessageParams = {"service_name": self._service_name}
+            # Joining all log records is only worth it if there is a channel
+            # to report to.
+            if reporter.channels:
+                data["log_records"] = self._log_handler.all_records
             raise CommandWatcherError(
                 "The command '{}' exists with an non-zero return code ({}).".format(
                     " ".join(process.args_normalized), rc
                 ),
-                service_name=self._service_name,
-                log_records=self._log_handler.all_records,
+                **data,
             )
         return process
 
@@ -961,6 +1431,7 @@ class Watch:
             **data,
         )
         self.log.debug(message)
+        self._log_handler.flush_console()
         return message
 
     def final_report(self, **data: Unpack[MessageParams]) -> Message:
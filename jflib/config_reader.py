@@ -34,44 +34,69 @@ INI file (`ini`):
     key = value
 
 """
-import abc
 import argparse
 import ast
 import configparser
+import copy
+import functools
 import os
 import re
+import string
 import typing
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict, Union
+
+_MISSING = object()
+"""Marks a value which couldn’t be found, `None` may be a valid value."""
 
 
 class ConfigValueError(Exception):
-    """Configuration value can’t be found."""
+    """Configuration value can’t be found.
+
+    The message can be a template, which is only formatted with the
+    remaining arguments if the exception is converted into a string. Most
+    of these exceptions are caught by :py:class:`ReaderSelector`."""
+
+    def __str__(self) -> str:
+        if len(self.args) > 1:
+            return self.args[0].format(*self.args[1:])
+        return super().__str__()
 
 
 class IniReaderError(Exception):
     """Ini file not valid."""
 
 
+_KEY_DELETE_TABLE = str.maketrans("", "", string.ascii_letters + string.digits + "_")
+"""Deletes the allowed characters of section and key names: a valid name
+translates to an empty string."""
+
+
+@functools.lru_cache(maxsize=1024)
 def validate_key(key: str) -> bool:
-    """:param key: Validate the name of a section or a key."""
-    if re.match(r"^[a-zA-Z0-9_]+$", key):
+    """:param key: Validate the name of a section or a key.
+
+    Valid keys are cached, invalid keys raise every time."""
+    if key and not key.translate(_KEY_DELETE_TABLE):
         return True
     raise ValueError(
-        "The key “{}” contains invalid characters (allowed: a-zA-Z0-9_).".format(key)
+        f"The key “{key}” contains invalid characters (allowed: a-zA-Z0-9_)."
     )
 
 
 # Reader classes ##############################################################
 
 
-class ReaderBase(object, metaclass=abc.ABCMeta):
+class ReaderBase:
     """Base class for all readers"""
 
-    def _exception(self, msg: str):
-        """:raises: ConfigValueError"""
-        raise ConfigValueError(msg)
+    __slots__ = ()
+
+    def _exception(self, msg: str, *values: Any):
+        """:param msg: A message template, formatted lazily with `values`.
+
+        :raises: ConfigValueError"""
+        raise ConfigValueError(msg, *values)
 
-    @abc.abstractmethod
     def get(self, section: str, key: str) -> Any:
         raise NotImplementedError("A reader class must have a `get` method.")
 
@@ -118,11 +143,25 @@ class ArgparseReader(ReaderBase):
       `dest` is the property name of the `args` object.
     """
 
+    __slots__ = ("_args", "_args_dict", "_dests", "_mapping")
+
     _mapping: Mapping
 
+    _args_dict: Dict[str, Any]
+    """The attribute dictionary of the namespace, read with a single dict
+    lookup per value. Empty if the object has no `__dict__`."""
+
+    _dests: Dict[typing.Tuple[str, str], str]
+    """The resolved `dest` names by section and key."""
+
     def __init__(self, args: argparse.Namespace, mapping: Mapping = {}):
         self._args = args
+        try:
+            self._args_dict = vars(args)
+        except TypeError:
+            self._args_dict = {}
         self._mapping = mapping
+        self._dests = {}
 
     def get(self, section: str, key: str) -> typing.Any:
         """
@@ -135,20 +174,25 @@ class ArgparseReader(ReaderBase):
 
         :return: The configuration value stored under a section and a key.
         """
-        mapping_key = "{}.{}".format(section, key)
-        if mapping_key in self._mapping:
-            argparse_dest = self._mapping[mapping_key]
-        else:
-            argparse_dest = "{}_{}".format(section, key).lower()
-
-        if hasattr(self._args, argparse_dest):
-            value = getattr(self._args, argparse_dest)
-            if value is not None:
-                return value
+        argparse_dest = self._dests.get((section, key))
+        if argparse_dest is None:
+            argparse_dest = self._mapping.get(f"{section}.{key}")
+            if argparse_dest is None:
+                argparse_dest = f"{section}_{key}".lower()
+            self._dests[(section, key)] = argparse_dest
+
+        value = self._args_dict.get(argparse_dest)
+        if value is None:
+            # Slots, properties and class attributes are not in `__dict__`.
+            value = getattr(self._args, argparse_dest, None)
+        if value is not None:
+            return value
 
         self._exception(
             "Configuration value could not be found by "
-            "Argparse (section “{}” key “{}”).".format(section, key)
+            "Argparse (section “{}” key “{}”).",
+            section,
+            key,
         )
 
 
@@ -158,6 +202,8 @@ class DictionaryReader(ReaderBase):
     :param dictionary: A nested dictionary.
     """
 
+    __slots__ = ("_dictionary",)
+
     def __init__(self, dictionary: Dict[str, Any]):
         self._dictionary = dictionary
 
@@ -172,12 +218,12 @@ class DictionaryReader(ReaderBase):
 
         :return: The configuration value stored under a section and a key.
         """
-        try:
-            return self._dictionary[section][key]
-        except KeyError:
+        value = self._dictionary.get(section, {}).get(key, _MISSING)
+        if value is _MISSING:
             self._exception(
-                "In the dictionary is no value at dict[{}][{}]".format(section, key)
+                "In the dictionary is no value at dict[{}][{}]", section, key
             )
+        return value
 
 
 class EnvironReader(ReaderBase):
@@ -185,10 +231,35 @@ class EnvironReader(ReaderBase):
     of the environment variables have to be in the form `prefix__section__key`.
     Note the two following underscores.
 
+    The matching environment variables are read once when the reader is
+    created. Call :meth:`refresh` to pick up later changes.
+
     :param prefix: A enviroment prefix"""
 
+    __slots__ = ("_environ", "_prefix", "_prefix_fmt")
+
+    _environ: Dict[str, str]
+    """The environment variables starting with the prefix, stored without
+    the prefix."""
+
     def __init__(self, prefix: Optional[str] = None):
         self._prefix = prefix
+        self._prefix_fmt = f"{prefix}__" if prefix else ""
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Read the environment variables again."""
+        prefix = self._prefix_fmt
+        if not prefix:
+            self._environ = dict(os.environ)
+            return
+        length = len(prefix)
+        startswith = str.startswith
+        self._environ = {
+            name[length:]: value
+            for name, value in os.environ.items()
+            if startswith(name, prefix)
+        }
 
     def get(self, section: str, key: str) -> typing.Any:
         """
@@ -201,28 +272,119 @@ class EnvironReader(ReaderBase):
 
         :return: The configuration value stored under a section and a key.
         """
-        if self._prefix:
-            key = "{}__{}__{}".format(self._prefix, section, key)
-        else:
-            key = "{}__{}".format(section, key)
-        if key in os.environ:
-            return os.environ[key]
-        self._exception("Environment variable not found: {}".format(key))
+        name = f"{section}__{key}"
+        value = self._environ.get(name)
+        if value is not None:
+            return value
+        self._exception("Environment variable not found: {}{}", self._prefix_fmt, name)
+
+
+_SECTION_RE = re.compile(r"\[([^\]]+)\]")
+"""A section header: `[section]`."""
+
+_KV_RE = re.compile(r"([^=:\s][^=:]*?)\s*[=:]\s*(.*)")
+"""An option: `key = value` or `key: value`."""
+
+
+def _parse_ini(text: str) -> Optional[Dict[str, Dict[str, str]]]:
+    """Parse simple INI files into nested dictionaries without
+    :class:`configparser.ConfigParser`. Keys are lower cased like
+    :meth:`configparser.ConfigParser.optionxform` does. Interpolation
+    (`%`), continuation lines, duplicates and the `DEFAULT` section are not
+    supported.
+
+    :param text: The content of an INI file.
+
+    :return: `None` if the file uses a feature the parser doesn’t support.
+    """
+    if "%" in text:
+        return None
+    config: Dict[str, Dict[str, str]] = {}
+    section: Optional[Dict[str, str]] = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped[0] in "#;":
+            continue
+        if line[0].isspace():
+            return None
+        match = _SECTION_RE.fullmatch(stripped)
+        if match:
+            name = match.group(1)
+            if name in config or name == configparser.DEFAULTSECT:
+                return None
+            section = config[name] = {}
+            continue
+        match = _KV_RE.fullmatch(stripped)
+        if not match or section is None:
+            return None
+        key = match.group(1).lower()
+        if key in section:
+            return None
+        section[key] = match.group(2)
+    return config
+
+
+_IniConfig = Union[Dict[str, Dict[str, str]], configparser.ConfigParser]
+
+
+def _flatten_config_parser(parser: configparser.ConfigParser) -> _IniConfig:
+    """Copy the interpolated values of all sections into nested
+    dictionaries, so that they can be read without the section proxies.
+
+    :return: The parser itself if a value can’t be interpolated. The error
+      is raised when the value is read."""
+    sections = [parser.default_section, *parser.sections()]
+    try:
+        return {section: dict(parser.items(section)) for section in sections}
+    except configparser.InterpolationError:
+        return parser
+
+
+@functools.lru_cache(maxsize=32)
+def _load_ini(path: str, mtime_ns: int, size: int, strict: bool) -> _IniConfig:
+    """Parse an INI file. The results are cached by the absolute path,
+    modification time and size, so a changed file is parsed again. The
+    readers only read the parsed configuration, so it can be shared."""
+    with open(path) as ini_file:
+        text = ini_file.read()
+    config = None if strict else _parse_ini(text)
+    if config is None:
+        parser = configparser.ConfigParser()
+        parser.read_string(text, source=path)
+        config = _flatten_config_parser(parser)
+    return config
 
 
 class IniReader(ReaderBase):
     """Read configuration files from text files in the INI format.
 
+    Simple files are parsed into plain dictionaries. Files using
+    interpolation, continuation lines or the `DEFAULT` section are read
+    by :class:`configparser.ConfigParser` and then copied into
+    dictionaries as well.
+
+    The file is parsed when the reader is created, so syntax errors are
+    raised right away. The parsed files are cached, an unchanged file is not
+    parsed again.
+
     :param path: The path of the INI file.
+    :param strict: Always use :class:`configparser.ConfigParser`.
     """
 
-    def __init__(self, path: str):
-        self._config = configparser.ConfigParser()
-        if not path or not os.path.exists(path):
-            raise IniReaderError(
-                "Ini configuration path “{}” couldn’t be opened.".format(path)
-            )
-        self._config.read_file(open(path))
+    __slots__ = ("_config",)
+
+    _config: _IniConfig
+
+    def __init__(self, path: str, strict: bool = False):
+        try:
+            if not path:
+                raise OSError
+            stat = os.stat(path)
+        except OSError:
+            raise IniReaderError(f"Ini configuration path “{path}” couldn’t be opened.")
+        self._config = _load_ini(
+            os.path.abspath(path), stat.st_mtime_ns, stat.st_size, strict
+        )
 
     def get(self, section: str, key: str) -> typing.Any:
         """
@@ -235,13 +397,19 @@ class IniReader(ReaderBase):
 
         :return: The configuration value stored under a section and a key.
         """
-        try:
-            return self._config[section][key]
-        except KeyError:
+        config = self._config
+        value = (
+            config[section].get(key.lower(), _MISSING)
+            if section in config
+            else _MISSING
+        )
+        if value is _MISSING:
             self._exception(
-                "Configuration value could not be found "
-                "(section “{}” key “{}”).".format(section, key)
+                "Configuration value could not be found (section “{}” key “{}”).",
+                section,
+                key,
             )
+        return value
 
 
 class SpecReader(ReaderBase):
@@ -250,10 +418,21 @@ class SpecReader(ReaderBase):
     :param spec: The `spec` (specification) dictionary.
     """
 
+    __slots__ = ("_defaults", "_spec")
+
     _spec: Spec
 
+    _defaults: Dict[typing.Tuple[str, str], Any]
+    """The default values by section and key."""
+
     def __init__(self, spec: Spec):
         self._spec = spec
+        self._defaults = {
+            (section, key): key_spec["default"]
+            for section, keys in spec.items()
+            for key, key_spec in keys.items()
+            if "default" in key_spec
+        }
 
     def get(self, section: str, key: str) -> typing.Any:
         """
@@ -266,28 +445,47 @@ class SpecReader(ReaderBase):
 
         :return: The configuration value stored under a section and a key.
         """
-        try:
-            return self._spec[section][key]["default"]
-        except KeyError:
+        value = self._defaults.get((section, key), _MISSING)
+        if value is _MISSING:
             self._exception(
-                "Configuration value could not be found "
-                "(section “{}” key “{}”).".format(section, key)
+                "Configuration value could not be found (section “{}” key “{}”).",
+                section,
+                key,
             )
+        return value
 
 
 # Common code #################################################################
 
 
 class ReaderSelector(ReaderBase):
-    """Select for each get request which reader to use."""
+    """Select for each get request which reader to use.
+
+    The results are cached: each section and key is looked up only once in
+    the readers, also if no reader knows the value. Call :py:meth:`invalidate`
+    if the underlying configuration changes, for example the environment
+    variables."""
+
+    __slots__ = ("_cache", "readers")
+
+    _cache: Dict[typing.Tuple[str, str], Any]
+    """The found values, or `_MISSING` if no reader has a value."""
 
     def __init__(self, *readers: ReaderBase):
         self.readers = readers
         """A list of readers."""
 
-    @staticmethod
-    def _validate_key(key: str):
-        return validate_key(key)
+        self._cache = {}
+
+    def _lookup(self, section: str, key: str) -> Any:
+        validate_key(section)
+        validate_key(key)
+        for reader in self.readers:
+            try:
+                return reader.get(section, key)
+            except ConfigValueError:
+                pass
+        return _MISSING
 
     def get(self, section: str, key: str):
         """
@@ -296,21 +494,61 @@ class ReaderSelector(ReaderBase):
         :param section: Name of the section.
         :param key: Name of the key.
         """
-        self._validate_key(section)
-        self._validate_key(key)
-        for reader in self.readers:
-            try:
-                return reader.get(section, key)
-            except ConfigValueError:
-                pass
-        raise ValueError(
-            "Configuration value could not be found "
-            "(section “{}” key “{}”).".format(section, key)
-        )
+        cache_key = (section, key)
+        if cache_key in self._cache:
+            value = self._cache[cache_key]
+        else:
+            value = self._lookup(section, key)
+            self._cache[cache_key] = value
+        if value is _MISSING:
+            raise ValueError(
+                "Configuration value could not be found "
+                f"(section “{section}” key “{key}”)."
+            )
+        return value
 
+    def invalidate(self, section: Optional[str] = None, key: Optional[str] = None):
+        """Remove cached values, so that they are read again by the readers.
 
-def auto_type(value: Any) -> Any:
-    """https://stackoverflow.com/a/7019325"""
+        :param section: Only remove the values of this section. All values
+          are removed if no section is specified.
+        :param key: Only remove the value of this key in the section.
+        """
+        if section is None:
+            self._cache.clear()
+        elif key is None:
+            for cache_key in [k for k in self._cache if k[0] == section]:
+                del self._cache[cache_key]
+        else:
+            self._cache.pop((section, key), None)
+
+
+_CONSTANTS: Dict[str, Any] = {"True": True, "False": False, "None": None}
+
+_FLOAT_RE = re.compile(r"-?[0-9]+\.[0-9]+(?:[eE][-+]?[0-9]+)?")
+
+
+_LITERAL_FIRST_CHARS = frozenset("0123456789-+.'\"([{TFNbBrRuUs")
+"""The characters a Python literal can start with: numbers, strings (also
+with a prefix), containers, constants and `set()`."""
+
+
+@functools.lru_cache(maxsize=1024)
+def _auto_type_str(value: str) -> Any:
+    if not value or (value[0] not in _LITERAL_FIRST_CHARS and not value[0].isspace()):
+        return value
+    digits = value[1:] if value[:1] == "-" else value
+    # Python doesn’t allow leading zeros in integer literals: “007”
+    if digits.isdecimal() and digits.isascii() and (digits[0] != "0" or digits == "0"):
+        try:
+            return int(value)
+        except ValueError:
+            # Exceeds the limit of the integer string conversion length.
+            return value
+    if value in _CONSTANTS:
+        return _CONSTANTS[value]
+    if _FLOAT_RE.fullmatch(value):
+        return float(value)
     try:
         return ast.literal_eval(value)
     except ValueError:
@@ -322,7 +560,24 @@ def auto_type(value: Any) -> Any:
         return value
 
 
+def auto_type(value: Any) -> Any:
+    """https://stackoverflow.com/a/7019325
+
+    The most common values (integers, floats, `True`, `False` and `None`)
+    are converted without parsing them by :py:func:`ast.literal_eval`. The
+    results are cached."""
+    if not isinstance(value, str):
+        return value
+    result = _auto_type_str(value)
+    if isinstance(result, (list, dict, set, tuple)):
+        # The cached container must not be changed by the caller.
+        return copy.deepcopy(result)
+    return result
+
+
 class DictionaryInterfaceKey:
+    __slots__ = ("_reader", "_section")
+
     def __init__(self, reader: ReaderBase, section: str):
         self._reader = reader
         self._section = section
@@ -332,28 +587,81 @@ class DictionaryInterfaceKey:
 
 
 class DictionaryInterface:
-    def __init__(self, reader: ReaderBase):
+    __slots__ = ("_reader", "_sections")
+
+    _sections: Dict[str, DictionaryInterfaceKey]
+
+    def __init__(self, reader: ReaderBase, sections: typing.Iterable[str] = ()):
         self._reader = reader
+        self._sections = {
+            section: DictionaryInterfaceKey(reader, section=section)
+            for section in sections
+        }
 
     def __getitem__(self, name: str):
-        return DictionaryInterfaceKey(self._reader, section=name)
+        section = self._sections.get(name)
+        if section is None:
+            section = DictionaryInterfaceKey(self._reader, section=name)
+            self._sections[name] = section
+        return section
+
+
+def _is_dunder(name: str) -> bool:
+    """Special names like `__deepcopy__` are looked up by :py:mod:`copy`,
+    :py:mod:`pickle` and others. They are no sections or keys."""
+    return name[:2] == "__" and name[-2:] == "__"
 
 
 class ClassInterfaceKey:
+    __slots__ = ("_reader", "_section")
+
     def __init__(self, reader: ReaderBase, section: str):
         self._reader = reader
         self._section = section
 
     def __getattr__(self, name: str):
+        if _is_dunder(name):
+            raise AttributeError(name)
         return auto_type(self._reader.get(self._section, name))
 
 
 class ClassInterface:
-    def __init__(self, reader: ReaderBase):
+    __slots__ = ("_reader", "_sections")
+
+    _sections: Dict[str, ClassInterfaceKey]
+
+    def __init__(self, reader: ReaderBase, sections: typing.Iterable[str] = ()):
         self._reader = reader
+        self._sections = {
+            section: ClassInterfaceKey(reader, section=section) for section in sections
+        }
 
     def __getattr__(self, name: str):
-        return ClassInterfaceKey(self._reader, section=name)
+        if _is_dunder(name):
+            raise AttributeError(name)
+        section = self._sections.get(name)
+        if section is None:
+            section = ClassInterfaceKey(self._reader, section=name)
+            self._sections[name] = section
+        return section
+
+
+def _make_argparse_reader(value: Any) -> Optional[ArgparseReader]:
+    if isinstance(value, (tuple, list)):
+        return ArgparseReader(args=value[0], mapping=value[1])
+    if value.__class__.__name__ == "Namespace":
+        return ArgparseReader(args=value)
+    return None
+
+
+_READER_FACTORIES: Dict[str, typing.Callable[[Any], Optional[ReaderBase]]] = {
+    "argparse": _make_argparse_reader,
+    "dictionary": lambda value: DictionaryReader(dictionary=value),
+    "environ": lambda value: EnvironReader(prefix=value),
+    "ini": lambda value: IniReader(path=value),
+    "spec": lambda value: SpecReader(spec=value),
+}
+"""The reader classes by the keywords of :py:func:`load_readers_by_keyword`."""
 
 
 def load_readers_by_keyword(**kwargs: Any) -> List[ReaderBase]:
@@ -376,19 +684,11 @@ def load_readers_by_keyword(**kwargs: Any) -> List[ReaderBase]:
     """
     readers: List[ReaderBase] = []
     for keyword, value in kwargs.items():
-        if keyword == "argparse":
-            if isinstance(value, tuple) or isinstance(value, list):
-                readers.append(ArgparseReader(args=value[0], mapping=value[1]))
-            elif value.__class__.__name__ == "Namespace":
-                readers.append(ArgparseReader(args=value))
-        elif keyword == "dictionary":
-            readers.append(DictionaryReader(dictionary=value))
-        elif keyword == "environ":
-            readers.append(EnvironReader(prefix=value))
-        elif keyword == "ini":
-            readers.append(IniReader(path=value))
-        elif keyword == "spec":
-            readers.append(SpecReader(spec=value))
+        factory = _READER_FACTORIES.get(keyword)
+        if factory is not None:
+            reader = factory(value)
+            if reader is not None:
+                readers.append(reader)
     return readers
 
 
@@ -412,7 +712,10 @@ class ConfigReader:
     """
 
     spec: Spec
-    reader: ReaderBase
+    reader: ReaderSelector
+
+    _class_interface: Optional[ClassInterface]
+    _dictionary_interface: Optional[DictionaryInterface]
 
     def __init__(self, spec: Spec = {}, **kwargs):
         if spec:
@@ -426,11 +729,34 @@ class ConfigReader:
         self.reader = ReaderSelector(*readers)
         """:py:class:`ReaderSelector`"""
 
+        self._class_interface = None
+        self._dictionary_interface = None
+
     def get_class_interface(self) -> ClassInterface:
-        return ClassInterface(self.reader)
+        """The interface is created once. The sections of the spec are set
+        up in advance."""
+        if self._class_interface is None:
+            self._class_interface = ClassInterface(self.reader, self.spec)
+        return self._class_interface
 
     def get_dictionary_interface(self) -> DictionaryInterface:
-        return DictionaryInterface(self.reader)
+        """The interface is created once. The sections of the spec are set
+        up in advance."""
+        if self._dictionary_interface is None:
+            self._dictionary_interface = DictionaryInterface(self.reader, self.spec)
+        return self._dictionary_interface
+
+    def invalidate(
+        self, section: Optional[str] = None, key: Optional[str] = None
+    ) -> None:
+        """Read values again, for example after changing environment
+        variables. The environment variables are read again and the values
+        are removed from the cache (see :py:meth:`ReaderSelector.invalidate`).
+        """
+        for reader in self.reader.readers:
+            if isinstance(reader, EnvironReader):
+                reader.refresh()
+        self.reader.invalidate(section, key)
 
     def check_section(self, section: str, not_empty: bool = False) -> bool:
         """Check all keys of a section.
@@ -444,7 +770,7 @@ class ConfigReader:
             value = self.reader.get(section, key)
             if "not_empty" in value_spec and value_spec["not_empty"] and not value:
                 raise ValueError(
-                    "Spec check: section ”{}” key “{}” is empty.".format(section, key)
+                    f"Spec check: section ”{section}” key “{key}” is empty."
                 )
         return True
 
@@ -454,7 +780,7 @@ class ConfigReader:
                 title=section, description="Generated by the config_reader."
             )
             for key, value in self.spec[section].items():
-                argument = "--{}-{}".format(section, key).replace("_", "-")
+                argument = f"--{section}-{key}".replace("_", "-")
                 kwargs = {}
                 if "description" in value:
                     kwargs["help"] = value["description"]
@@ -1,23 +1,31 @@
-import json
+import functools
+import warnings
 from typing import Optional
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
 
-urllib3.disable_warnings()
+_SESSION = requests.Session()
+"""Reuses the connections to the Icinga API across several checks."""
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
+_HEADERS = {"Accept": "application/json", "X-HTTP-Method-Override": "POST"}
 
 STATE_OK = 0
 STATE_WARNING = 1
 STATE_CRITICAL = 2
 STATE_UNKNOWN = 3
 
-States = {
-    STATE_OK: "OK",
-    STATE_WARNING: "WARNING",
-    STATE_CRITICAL: "CRITICAL",
-    STATE_UNKNOWN: "UNKNOWN",
-}
+States = ("OK", "WARNING", "CRITICAL", "UNKNOWN")
+"""The names of the states, indexed by the state numbers."""
+
+
+@functools.lru_cache(maxsize=128)
+def _service_filter(host_name: str, service_name: str) -> str:
+    """The filter is built once for each service, since the same services
+    are checked again and again."""
+    return f'host.name=="{host_name}" && service.name=="{service_name}"'
 
 
 def send_passive_check(
@@ -38,13 +46,10 @@ def send_passive_check(
     user
     password
     """
-    request_url = "{}/v1/actions/process-check-result".format(url)
-    headers = {"Accept": "application/json", "X-HTTP-Method-Override": "POST"}
+    request_url = f"{url}/v1/actions/process-check-result"
     data = {
         "type": "Service",
-        "filter": 'host.name=="{}" && service.name=="{}"'.format(
-            host_name, service_name
-        ),
+        "filter": _service_filter(host_name, service_name),
         "exit_status": status,
         "plugin_output": text_output,
     }
@@ -52,10 +57,13 @@ def send_passive_check(
     if performance_data:
         data["performance_data"] = performance_data
 
-    return requests.post(
-        request_url,
-        headers=headers,
-        auth=(user, password),
-        data=json.dumps(data),
-        verify=False,
-    )
+    # The certificate isn’t verified, only for this request.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", urllib3.exceptions.InsecureRequestWarning)
+        return _SESSION.post(
+            request_url,
+            headers=_HEADERS,
+            auth=(user, password),
+            json=data,
+            verify=False,
+        )
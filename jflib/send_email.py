@@ -2,6 +2,66 @@ import smtplib
 from email.header import Header
 from email.mime.text import MIMEText
 from email.utils import formatdate
+from typing import Dict, Optional, Tuple
+
+
+class SMTPMailer:
+    """Send several emails over one SMTP connection.
+
+    .. code:: python
+
+        with SMTPMailer("login", "password", "smtp.example.com:587") as mailer:
+            mailer.send("from@example.com", "to@example.com", "Subject", "Body")
+
+    :param smtp_login: The SMTP login name.
+    :param smtp_password: The SMTP password.
+    :param smtp_server: The URL of the SMTP server, for
+      example: `smtp.example.com:587`.
+    """
+
+    _server: Optional[smtplib.SMTP]
+
+    def __init__(self, smtp_login: str, smtp_password: str, smtp_server: str):
+        self._smtp_login = smtp_login
+        self._smtp_password = smtp_password
+        self._smtp_server = smtp_server
+        self._server = None
+
+    def __enter__(self) -> "SMTPMailer":
+        server = smtplib.SMTP(self._smtp_server)
+        server.starttls()
+        server.login(self._smtp_login, self._smtp_password)
+        self._server = server
+        return self
+
+    def __exit__(self, *args) -> None:
+        if self._server is not None:
+            self._server.quit()
+            self._server = None
+
+    def send(
+        self, from_addr: str, to_addr: str, subject: str, body: str
+    ) -> Dict[str, Tuple[int, bytes]]:
+        """
+        Send a email.
+
+        :param from_addr: The email address of the sender.
+        :param to_addr: The email address of the recipient.
+        :param subject: The email subject.
+        :param body: The email body.
+
+        :return: Problems
+        """
+        if self._server is None:
+            raise RuntimeError("SMTPMailer must be used as a context manager.")
+        message = MIMEText(body, "plain", "utf-8")
+
+        message["Subject"] = Header(subject, "utf-8")
+        message["From"] = from_addr
+        message["To"] = to_addr
+        message["Date"] = formatdate(localtime=True)
+
+        return self._server.sendmail(from_addr, [to_addr], message.as_string())
 
 
 def send_email(
@@ -27,16 +87,5 @@ def send_email(
 
     :return: Problems
     """
-    message = MIMEText(body, "plain", "utf-8")
-
-    message["Subject"] = Header(subject, "utf-8")
-    message["From"] = from_addr
-    message["To"] = to_addr
-    message["Date"] = formatdate(localtime=True)
-
-    server = smtplib.SMTP(smtp_server)
-    server.starttls()
-    server.login(smtp_login, smtp_password)
-    problems = server.sendmail(from_addr, [to_addr], message.as_string())
-    server.quit()
-    return problems
+    with SMTPMailer(smtp_login, smtp_password, smtp_server) as mailer:
+        return mailer.send(from_addr, to_addr, subject, body)
@@ -83,31 +83,58 @@ COLORS = dict(
 
 RESET = "\033[0m"
 
+_COLORS_DISABLED = os.getenv("ANSI_COLORS_DISABLED") is not None
+"""The environment variable is read once on import."""
+
+
+# 7-bit and 8-bit C1 ANSI sequences
+_ANSI_ESCAPE_8BIT = re.compile(
+    r"""
+    (?: # either 7-bit C1, two bytes, ESC Fe (omitting CSI)
+        \x1B
+        [@-Z\\-_]
+    |   # or a single 8-bit byte Fe (omitting CSI)
+        [\x80-\x9A\x9C-\x9F]
+    |   # or CSI + control codes
+        (?: # 7-bit CSI, ESC [
+            \x1B\[
+        |   # 8-bit CSI, 9B
+            \x9B
+        )
+        [0-?]*  # Parameter bytes
+        [ -/]*  # Intermediate bytes
+        [@-~]   # Final byte
+    )
+""",
+    re.VERBOSE,
+)
+
+# Only the 7-bit sequences: single bytes from 0x80 to 0x9F are part of UTF-8
+# encoded characters.
+_ANSI_ESCAPE_7BIT_BYTES = re.compile(
+    rb"""
+    \x1B
+    (?: # 7-bit C1, two bytes, ESC Fe (omitting CSI)
+        [@-Z\\-_]
+    |   # or CSI + control codes
+        \[
+        [0-?]*  # Parameter bytes
+        [ -/]*  # Intermediate bytes
+        [@-~]   # Final byte
+    )
+""",
+    re.VERBOSE,
+)
+
 
 def remove_color(text: str) -> str:
     """https://stackoverflow.com/a/14693789/10193818"""
-    # 7-bit and 8-bit C1 ANSI sequences
-    ansi_escape_8bit = re.compile(
-        r"""
-        (?: # either 7-bit C1, two bytes, ESC Fe (omitting CSI)
-            \x1B
-            [@-Z\\-_]
-        |   # or a single 8-bit byte Fe (omitting CSI)
-            [\x80-\x9A\x9C-\x9F]
-        |   # or CSI + control codes
-            (?: # 7-bit CSI, ESC [
-                \x1B\[
-            |   # 8-bit CSI, 9B
-                \x9B
-            )
-            [0-?]*  # Parameter bytes
-            [ -/]*  # Intermediate bytes
-            [@-~]   # Final byte
-        )
-    """,
-        re.VERBOSE,
-    )
-    return ansi_escape_8bit.sub("", text)
+    return _ANSI_ESCAPE_8BIT.sub("", text)
+
+
+def remove_color_bytes(text: bytes) -> bytes:
+    """Remove the 7-bit ANSI sequences from bytes, without decoding them."""
+    return _ANSI_ESCAPE_7BIT_BYTES.sub(b"", text)
 
 
 def colored(
@@ -131,20 +158,18 @@ def colored(
         colored('Hello, World!', 'red', 'on_grey', ['blue', 'blink'])
         colored('Hello, World!', 'green')
     """
-    if os.getenv("ANSI_COLORS_DISABLED") is None:
-        fmt_str = "\033[%dm%s"
-        if color is not None:
-            text = fmt_str % (COLORS[color], text)
-
-        if on_color is not None:
-            text = fmt_str % (HIGHLIGHTS[on_color], text)
-
-        if attrs is not None:
-            for attr in attrs:
-                text = fmt_str % (ATTRIBUTES[attr], text)
-
-        text += RESET
-    return text
+    if _COLORS_DISABLED:
+        return text
+    codes: List[int] = []
+    if attrs is not None:
+        codes.extend(ATTRIBUTES[attr] for attr in reversed(attrs))
+    if on_color is not None:
+        codes.append(HIGHLIGHTS[on_color])
+    if color is not None:
+        codes.append(COLORS[color])
+    if not codes:
+        return text + RESET
+    return f"\033[{';'.join(map(str, codes))}m{text}{RESET}"
 
 
 def cprint(
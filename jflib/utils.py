@@ -4,6 +4,10 @@ import os
 import shutil
 import stat
 import urllib.request
+from typing import Iterable, Optional
+
+COPY_BUFFER_SIZE = 1024 * 1024
+"""The buffer size in bytes to copy the downloads with."""
 
 
 def download(url: str, dest: str) -> None:
@@ -13,7 +17,7 @@ def download(url: str, dest: str) -> None:
     :param dest: The path of the destination file.
     """
     with urllib.request.urlopen(url) as response, open(dest, "wb") as out_file:
-        shutil.copyfileobj(response, out_file)
+        shutil.copyfileobj(response, out_file, length=COPY_BUFFER_SIZE)
 
 
 def make_executable(path: str) -> None:
@@ -23,3 +27,18 @@ def make_executable(path: str) -> None:
     """
     st = os.stat(path)
     os.chmod(path, st.st_mode | stat.S_IEXEC)
+
+
+def make_executable_many(paths: Iterable[str], mode: Optional[int] = None) -> None:
+    """Make several files executable.
+
+    :param paths: The paths of the files.
+    :param mode: Set this mode (for example `0o755`) without reading the
+      current mode of the files first. By default the user execute bit is
+      added like :py:func:`make_executable` does.
+    """
+    for path in paths:
+        if mode is None:
+            os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+        else:
+            os.chmod(path, mode)
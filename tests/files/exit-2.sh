@@ -1,5 +0,0 @@
-#! /bin/sh
-
-echo 'Exit with code 2' >&2
-
-exit 2
\ No newline at end of file
@@ -1,5 +0,0 @@
-#! /bin/sh
-
-echo 'One line to stderr!' >&2
-
-exit 1
\ No newline at end of file
@@ -1,3 +0,0 @@
-#! /bin/sh
-
-echo 'One line to stdout!'
\ No newline at end of file
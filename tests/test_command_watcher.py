@@ -1,5 +1,9 @@
+import logging
 import os
+import subprocess
+import threading
 import unittest
+from logging.handlers import BufferingHandler
 from unittest import mock
 
 from jflib import command_watcher as cwatcher
@@ -9,18 +13,98 @@ DIR_FILES = os.path.join(os.path.dirname(__file__), "files")
 CONF = os.path.join(DIR_FILES, "command_watcher", "conf.ini")
 FROM_ADDR = "{0} <{1}@{0}>".format(cwatcher.HOSTNAME, cwatcher.USERNAME)
 
+REAL_POPEN = subprocess.Popen
+
+# Commands answered by FakePopen: (stdout, stderr, returncode)
+FAKE_COMMANDS = {
+    "stdout.sh": (b"One line to stdout!\n", b"", 0),
+    "stderr.sh": (b"", b"One line to stderr!\n", 1),
+    "exit-2.sh": (b"", b"Exit with code 2\n", 2),
+}
+
+
+class FakePopen:
+    """Answer a command with canned output without spawning a process. The
+    output is written to real pipes, because `Process` reads them through
+    a selector."""
+
+    def __init__(self, args, stdout: bytes, stderr: bytes, returncode: int):
+        self.args = args
+        self.stdout = self._pipe(stdout)
+        self.stderr = self._pipe(stderr)
+        self.returncode = returncode
+
+    @staticmethod
+    def _pipe(data: bytes):
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, data)
+        os.close(write_fd)
+        return os.fdopen(read_fd, "rb", buffering=0)
+
+    def wait(self) -> int:
+        return self.returncode
+
+
+def fake_popen(args, **kwargs):
+    if args[0] in FAKE_COMMANDS:
+        return FakePopen(args, *FAKE_COMMANDS[args[0]])
+    return REAL_POPEN(args, **kwargs)
+
+
+def patch_popen(cls) -> None:
+    """Replace `subprocess.Popen` with :func:`fake_popen` for a test class."""
+    patcher = mock.patch("subprocess.Popen", side_effect=fake_popen)
+    patcher.start()
+    cls.addClassCleanup(patcher.stop)
+
 
 # Logging #####################################################################
 
 
 class TestLogging(unittest.TestCase):
+    logger: logging.Logger
+    handler: cwatcher.LoggingHandler
+
+    @classmethod
+    def setUpClass(cls):
+        cls.logger, cls.handler = cwatcher.setup_logging()
+
     def setUp(self):
-        logger, handler = cwatcher.setup_logging()
-        self.logger = logger
-        self.handler = handler
+        # All tests share one logger: reset everything a test may change.
+        self.handler.flush()
+        self.logger.setLevel(1)
+        self.handler.console_level = logging.NOTSET
+        self.handler.console_batch_size = 1
+        self.handler.console_flush_interval = 1.0
+
+    def tearDown(self):
+        with Capturing(), Capturing("stderr"):
+            self.handler.flush_console()
 
     def test_initialisation(self):
-        self.assertEqual(len(self.logger.name), 36)
+        self.assertTrue(self.logger.name.startswith("cwatch."))
+
+    def test_logger_not_registered(self):
+        self.assertNotIn(self.logger.name, logging.Logger.manager.loggerDict)
+
+    def test_logger_names_unique(self):
+        logger, _ = cwatcher.setup_logging()
+        self.assertNotEqual(logger.name, self.logger.name)
+
+    def test_logger_set_level(self):
+        self.logger.setLevel(logging.INFO)
+        self.assertFalse(self.logger.isEnabledFor(logging.DEBUG))
+        self.logger.setLevel(logging.DEBUG)
+        self.assertTrue(self.logger.isEnabledFor(logging.DEBUG))
+
+    def test_logger_disable(self):
+        self.logger.info("info")
+        logging.disable(logging.CRITICAL)
+        try:
+            self.logger.info("info")
+        finally:
+            logging.disable(logging.NOTSET)
+        self.assertEqual(len(self.handler.buffer), 1)
 
     def test_log_stdout(self):
         self.logger.stdout("stdout")
@@ -28,6 +112,11 @@ class TestLogging(unittest.TestCase):
         self.assertEqual(self.handler.buffer[0].msg, "stdout")
         self.assertEqual(self.handler.buffer[0].levelname, "STDOUT")
 
+    def test_log_stdout_disabled(self):
+        self.logger.setLevel(logging.INFO)
+        self.logger.stdout("stdout")
+        self.assertEqual(len(self.handler.buffer), 0)
+
     def test_log_stderr(self):
         self.logger.stderr("stderr")
         self.assertEqual(len(self.handler.buffer), 1)
@@ -46,6 +135,41 @@ class TestLogging(unittest.TestCase):
         self.logger.stdout("stdout")
         self.assertEqual(self.handler.stderr, "line 1\nline 2")
 
+    def test_property_stdout_lines(self):
+        self.logger.stdout("line 1")
+        self.assertEqual(self.handler.stdout, "line 1")
+        self.logger.stdout("line 2")
+        self.logger.stderr("stderr")
+        self.assertEqual(self.handler.stdout_lines, ("line 1", "line 2"))
+        self.assertEqual(self.handler.stdout, "line 1\nline 2")
+
+    def test_property_stderr_lines(self):
+        self.logger.stderr("line 1")
+        self.logger.stderr("line 2")
+        self.logger.stdout("stdout")
+        self.assertEqual(self.handler.stderr_lines, ("line 1", "line 2"))
+
+    def test_message_arguments(self):
+        with Capturing() as output:
+            self.logger.info("%s %d", "info", 1)
+        self.assertIn("info 1", output[0])
+        self.assertIn("info 1", self.handler.all_records)
+
+    def test_property_line_count(self):
+        self.logger.stdout("stdout 1")
+        self.logger.stdout("stdout 2")
+        self.logger.stderr("stderr")
+        self.assertEqual(self.handler.stdout_line_count, 2)
+        self.assertEqual(self.handler.stderr_line_count, 1)
+
+    def test_method_flush(self):
+        self.logger.stdout("stdout")
+        self.logger.stderr("stderr")
+        self.handler.flush()
+        self.assertEqual(len(self.handler.buffer), 0)
+        self.assertEqual(self.handler.stdout, "")
+        self.assertEqual(self.handler.stderr, "")
+
     def test_property_all_records(self):
         self.logger.stderr("stderr")
         self.logger.stdout("stdout")
@@ -56,71 +180,177 @@ class TestLogging(unittest.TestCase):
         self.assertIn("error", self.handler.all_records)
         self.assertIn("debug", self.handler.all_records)
 
+    def test_property_all_records_cached(self):
+        self.logger.info("info 1")
+        self.assertIs(self.handler.all_records, self.handler.all_records)
+        self.logger.info("info 2")
+        self.assertIn("info 2", self.handler.all_records)
+        self.handler.flush()
+        self.assertEqual(self.handler.all_records, "")
 
-class TestColorizedPrint(unittest.TestCase):
-    def setUp(self):
-        self.logger, _ = cwatcher.setup_logging()
-
-    def test_critical(self):
-        with Capturing(stream="stderr") as output:
-            self.logger.critical("CRITICAL 50")
-        self.assertEqual(
-            output[0][20:],
-            "\x1b[1m\x1b[7m\x1b[31m CRITICAL "
-            "\x1b[0m \x1b[1m\x1b[31mCRITICAL 50\x1b[0m",
-        )
-
-    def test_error(self):
-        with Capturing(stream="stderr") as output:
-            self.logger.error("ERROR 40")
-        self.assertEqual(
-            output[0][20:], "\x1b[7m\x1b[31m ERROR    \x1b[0m \x1b[31mERROR 40\x1b[0m"
-        )
-
-    def test_stderr(self):
+    def test_attribute_console_level(self):
+        self.handler.console_level = logging.INFO
+        with Capturing() as output:
+            self.logger.stdout("stdout")
+            self.logger.info("info")
+        self.assertEqual(len(output), 1)
+        self.assertIn("info", output[0])
+        self.assertEqual(len(self.handler.buffer), 2)
+
+    def test_argument_queue_console(self):
+        logger, handler = cwatcher.setup_logging(queue_console=True)
+        with Capturing() as output:
+            logger.info("info")
+            logger.stdout("stdout")
+            self.assertEqual(handler.stdout, "stdout")
+            handler.close()
+        self.assertEqual(len(output), 2)
+        self.assertIn("info", output[0])
+        self.assertIn("stdout", output[1])
+
+    def test_argument_queue_console_one_thread(self):
+        cwatcher.setup_logging(queue_console=True)
+        threads = threading.active_count()
+        for _ in range(10):
+            cwatcher.setup_logging(queue_console=True)
+        self.assertEqual(threading.active_count(), threads)
+
+    def test_argument_queue_console_flush_console(self):
+        logger, handler = cwatcher.setup_logging(queue_console=True)
+        handler.console_batch_size = 3
+        with Capturing() as output:
+            logger.info("info 1")
+            logger.info("info 2")
+            handler.flush_console()
+            self.assertEqual(handler._console_pending, [])
+        self.assertEqual(len(output), 2)
+        handler.close()
+
+    def test_argument_queue_console_print_error(self):
+        logger, handler = cwatcher.setup_logging(queue_console=True)
+        handler._print = mock.Mock(side_effect=BrokenPipeError)
         with Capturing(stream="stderr") as output:
-            self.logger.stderr("STDERR 35")
-        self.assertEqual(
-            output[0][20:],
-            "\x1b[2m\x1b[7m\x1b[31m STDERR   "
-            "\x1b[0m \x1b[2m\x1b[31mSTDERR 35\x1b[0m",
-        )
-
-    def test_warning(self):
+            logger.info("info")
+            handler.close()
+        self.assertIn("BrokenPipeError", output.tostring())
+        logger, handler = cwatcher.setup_logging(queue_console=True)
         with Capturing() as output:
-            self.logger.warning("WARNING 30")
-        self.assertEqual(
-            output[0][20:], "\x1b[7m\x1b[33m WARNING  \x1b[0m \x1b[33mWARNING 30\x1b[0m"
-        )
+            logger.info("info")
+            handler.close()
+        self.assertIn("info", output[0])
 
-    def test_info(self):
+    def test_argument_queue_console_batch_size(self):
+        logger, handler = cwatcher.setup_logging(queue_console=True)
+        handler.console_batch_size = 3
         with Capturing() as output:
-            self.logger.info("INFO 20")
-        self.assertEqual(
-            output[0][20:], "\x1b[7m\x1b[32m INFO     \x1b[0m \x1b[32mINFO 20\x1b[0m"
-        )
+            for i in range(5):
+                logger.info(f"info {i}")
+            handler.close()
+        self.assertEqual(len(output), 5)
+        self.assertIn("info 4", output[4])
+
+    def test_attribute_console_batch_size(self):
+        self.handler.console_batch_size = 3
+        with Capturing() as output:
+            self.logger.info("info 1")
+            self.logger.info("info 2")
+            self.assertEqual(len(self.handler._console_pending), 2)
+            self.logger.info("info 3")
+            self.assertEqual(len(self.handler._console_pending), 0)
+            self.logger.info("info 4")
+            self.logger.warning("warning")
+            self.assertEqual(len(self.handler._console_pending), 2)
+        self.assertEqual(len(output), 3)
 
-    def test_debug(self):
+    def test_attribute_console_batch_size_error(self):
+        self.handler.console_batch_size = 3
+        with Capturing(), Capturing("stderr") as output:
+            self.logger.info("info")
+            self.logger.error("error")
+            self.assertEqual(len(self.handler._console_pending), 0)
+        self.assertEqual(len(output), 1)
+        self.assertIn("error", output[0])
+
+    def test_attribute_console_flush_interval(self):
+        self.handler.console_batch_size = 10
+        self.handler.console_flush_interval = 0
         with Capturing() as output:
-            self.logger.debug("DEBUG 10")
-        self.assertEqual(
-            output[0][20:], "\x1b[7m\x1b[37m DEBUG    \x1b[0m \x1b[37mDEBUG 10\x1b[0m"
-        )
+            self.logger.info("info")
+            self.assertEqual(self.handler._console_pending, [])
+        self.assertEqual(len(output), 1)
 
-    def test_stdout(self):
+    def test_method_flush_console(self):
+        self.handler.console_batch_size = 10
         with Capturing() as output:
-            self.logger.stdout("STDOUT 5")
+            self.logger.info("info")
+            self.handler.flush_console()
+        self.assertEqual(len(output), 1)
+
+    def test_argument_capacity(self):
+        handler = cwatcher.LoggingHandler(capacity=2)
+        logger = logging.Logger("capacity")
+        logger.addHandler(handler)
+        with Capturing():
+            for line in ("line 1", "line 2", "line 3"):
+                logger.stdout(line)
+        self.assertEqual(len(handler.buffer), 2)
+        self.assertEqual(handler.stdout_lines, ("line 2", "line 3"))
+        self.assertEqual(handler.stdout_line_count, 3)
+
+
+COLORIZED_LEVEL_CASES = (
+    (50, "CRITICAL 50", "\x1b[1;7;31m CRITICAL \x1b[0m \x1b[1;31mCRITICAL 50\x1b[0m"),
+    (40, "ERROR 40", "\x1b[7;31m ERROR    \x1b[0m \x1b[31mERROR 40\x1b[0m"),
+    (35, "STDERR 35", "\x1b[2;7;31m STDERR   \x1b[0m \x1b[2;31mSTDERR 35\x1b[0m"),
+    (30, "WARNING 30", "\x1b[7;33m WARNING  \x1b[0m \x1b[33mWARNING 30\x1b[0m"),
+    (20, "INFO 20", "\x1b[7;32m INFO     \x1b[0m \x1b[32mINFO 20\x1b[0m"),
+    (10, "DEBUG 10", "\x1b[7;37m DEBUG    \x1b[0m \x1b[37mDEBUG 10\x1b[0m"),
+    (5, "STDOUT 5", "\x1b[2;7;37m STDOUT   \x1b[0m \x1b[2;37mSTDOUT 5\x1b[0m"),
+    (1, "NOTSET 0", "\x1b[7;30m Level 1  \x1b[0m \x1b[30mNOTSET 0\x1b[0m"),
+)
+"""The level number, the message and the expected colorized output."""
+
+
+class TestColorizedPrint(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.logger, cls.handler = cwatcher.setup_logging(colorize=True)
+
+    def test_levels(self):
+        for level, msg, expected in COLORIZED_LEVEL_CASES:
+            with self.subTest(level=level):
+                stream = "stderr" if level >= cwatcher.STDERR else "stdout"
+                with Capturing(stream=stream) as output:
+                    self.logger.log(level, msg)
+                self.assertEqual(output[0][20:], expected)
+
+    def test_style_custom_level_cached(self):
+        with Capturing():
+            self.logger.log(2, "level 2")
+        self.assertIn(2, cwatcher._LEVEL_STYLES)
+
+    def test_style_by_levelno(self):
+        record = logging.LogRecord("test", logging.ERROR, "", 0, "msg", (), None)
+        record.levelname = "RENAMED"
+        with Capturing(stream="stderr") as output:
+            self.handler._print(record)
         self.assertEqual(
-            output[0][20:],
-            "\x1b[2m\x1b[7m\x1b[37m STDOUT   \x1b[0m " "\x1b[2m\x1b[37mSTDOUT 5\x1b[0m",
+            output[0][20:], "\x1b[7;31m ERROR    \x1b[0m \x1b[31mmsg\x1b[0m"
         )
 
-    def test_noset(self):
+
+class TestPlainPrint(unittest.TestCase):
+    def test_info(self):
+        logger, _ = cwatcher.setup_logging(colorize=False)
         with Capturing() as output:
-            self.logger.log(1, "NOTSET 0")
-        self.assertEqual(
-            output[0][20:], "\x1b[7m\x1b[30m Level 1  \x1b[0m \x1b[30mNOTSET 0\x1b[0m"
-        )
+            logger.info("INFO 20")
+        self.assertEqual(output[0][20:], "INFO     INFO 20")
+
+    def test_stderr(self):
+        logger, _ = cwatcher.setup_logging(colorize=False)
+        with Capturing(stream="stderr") as output:
+            logger.stderr("STDERR 35")
+        self.assertEqual(output[0][20:], "STDERR   STDERR 35")
 
 
 # Reporting ###################################################################
@@ -151,6 +381,10 @@ class TestClassMessage(unittest.TestCase):
     def test_property_status_text(self):
         self.assertEqual(self.message.status_text, "OK")
 
+    def test_property_status_text_unknown_number(self):
+        self.assertEqual(cwatcher.Message(status=2).status_text, "CRITICAL")
+        self.assertEqual(cwatcher.Message(status=7).status_text, "UNKNOWN")
+
     def test_property_service_name_not_set(self):
         message = cwatcher.Message()
         self.assertEqual(message.service_name, "service_not_set")
@@ -185,6 +419,24 @@ class TestClassMessage(unittest.TestCase):
     def test_property_processes(self):
         self.assertEqual(self.message.processes, "(ls; ls -a)")
 
+    def test_property_body_cached(self):
+        self.assertIs(self.message.body, self.message.body)
+
+    def test_magic_method_str_truncated(self):
+        message = cwatcher.Message(custom_message="x" * 100)
+        self.assertIn(f"custom_message: '{'x' * 63}…'", str(message))
+
+    def test_attribute_str_attrs(self):
+        self.assertEqual(
+            cwatcher.Message._STR_ATTRS,
+            tuple(
+                attribute
+                for attribute in dir(self.message)
+                if not attribute.startswith("_")
+                and not callable(getattr(self.message, attribute))
+            ),
+        )
+
 
 class TestClassEmailChannel(unittest.TestCase):
     def setUp(self):
@@ -349,58 +601,80 @@ class TestClassBeepChannel(unittest.TestCase):
     def setUp(self):
         self.beep = cwatcher.BeepChannel()
 
-    def report(self, status: int):
-        message = cwatcher.Message(service_name="my_service", prefix="", status=status)
+    def test_statuses(self):
+        cases = (
+            (0, "4186.01", "50.0"),  # ok
+            (1, "261.626", "100.0"),  # warning
+            (2, "65.4064", "150.0"),  # critical
+            (3, "32.7032", "200.0"),  # unknown
+        )
         with mock.patch("subprocess.run") as subprocess_run:
-            self.beep.report(message)
-        return subprocess_run
-
-    def test_status_ok(self):
-        subprocess_run = self.report(0)
-        subprocess_run.assert_called_with(["beep", "-f", "4186.01", "-l", "50.0"])
-
-    def test_status_warning(self):
-        subprocess_run = self.report(1)
-        subprocess_run.assert_called_with(["beep", "-f", "261.626", "-l", "100.0"])
-
-    def test_status_critical(self):
-        subprocess_run = self.report(2)
-        subprocess_run.assert_called_with(["beep", "-f", "65.4064", "-l", "150.0"])
-
-    def test_status_unkown(self):
-        subprocess_run = self.report(3)
-        subprocess_run.assert_called_with(["beep", "-f", "32.7032", "-l", "200.0"])
+            for status, frequency, length in cases:
+                with self.subTest(status=status):
+                    subprocess_run.reset_mock()
+                    message = cwatcher.Message(
+                        service_name="my_service", prefix="", status=status
+                    )
+                    self.beep.report(message)
+                    subprocess_run.assert_called_once_with(
+                        ["beep", "-f", frequency, "-l", length]
+                    )
 
 
 # Main code ###################################################################
 
 
 class TestClassProcess(unittest.TestCase):
-    def setUp(self):
-        self.cmd_stderr = os.path.join(DIR_FILES, "stderr.sh")
-        self.cmd_stdout = os.path.join(DIR_FILES, "stdout.sh")
+    cmd_stderr = "stderr.sh"
+    cmd_stdout = "stdout.sh"
+
+    @classmethod
+    def setUpClass(cls):
+        patch_popen(cls)
 
     def launch_process(self, *args, **kwargs):
         return cwatcher.Process(*args, **kwargs)
 
+    def launch_mocked_process(self, *args, **kwargs):
+        """Launch a process without spawning a real one. The mocked
+        subprocess has no pipes and exits with 0."""
+        with mock.patch("subprocess.Popen") as Popen:
+            popen = Popen.return_value
+            popen.stdout = None
+            popen.stderr = None
+            popen.returncode = 0
+            self.Popen = Popen
+            return cwatcher.Process(*args, **kwargs)
+
     def test_attribute_args(self):
-        process = self.launch_process("ls -l")
+        process = self.launch_mocked_process("ls -l")
         self.assertEqual(process.args, "ls -l")
 
     def test_attribute_log(self):
-        process = self.launch_process("ls -l")
-        self.assertEqual(process.log.__class__.__name__, "Logger")
+        process = self.launch_mocked_process("ls -l")
+        self.assertIsInstance(process.log, logging.Logger)
 
     def test_attribute_log_handler(self):
-        process = self.launch_process("ls -l")
+        process = self.launch_mocked_process("ls -l")
         self.assertEqual(process.log_handler.__class__.__name__, "LoggingHandler")
 
     def test_attribute_subprocess(self):
+        process = self.launch_mocked_process("ls -l")
+        self.assertIs(process.subprocess, self.Popen.return_value)
+        self.Popen.assert_called_once_with(
+            ["ls", "-l"], stderr=-1, stdout=-1, bufsize=0
+        )
+
+    def test_attribute_subprocess_real(self):
         process = self.launch_process("ls -l")
         self.assertEqual(process.subprocess.__class__.__name__, "Popen")
 
     def test_property_args_normalized(self):
-        process = self.launch_process("ls -l")
+        process = self.launch_mocked_process("ls -l")
+        self.assertEqual(process.args_normalized, ["ls", "-l"])
+
+    def test_property_args_normalized_tuple(self):
+        process = self.launch_mocked_process(("ls", "-l"))
         self.assertEqual(process.args_normalized, ["ls", "-l"])
 
     def test_property_stdout(self):
@@ -421,18 +695,93 @@ class TestClassProcess(unittest.TestCase):
         self.assertEqual(process.line_count_stdout, 0)
         self.assertEqual(process.line_count_stderr, 1)
 
+    def test_propagate_to_root_logger(self):
+        handler = BufferingHandler(capacity=100)
+        logging.root.addHandler(handler)
+        try:
+            with Capturing():
+                self.launch_process([self.cmd_stdout])
+        finally:
+            logging.root.removeHandler(handler)
+        self.assertIn("One line to stdout!", [record.msg for record in handler.buffer])
+
+    def test_stdout_and_stderr_alternately(self):
+        with Capturing():
+            process = self.launch_process(
+                [os.path.join(DIR_FILES, "stdout-stderr-while.sh")]
+            )
+        self.assertEqual(process.log_handler.stdout_lines, ("stdout",) * 3)
+        self.assertEqual(process.log_handler.stderr_lines, ("stderr",) * 3)
+        self.assertEqual(process.subprocess.returncode, 0)
 
-class TestClassWatch(unittest.TestCase):
-    def setUp(self):
-        self.cmd_stderr = os.path.join(DIR_FILES, "stderr.sh")
-        self.cmd_stdout = os.path.join(DIR_FILES, "stdout.sh")
+    def test_invalid_utf8(self):
+        with Capturing():
+            process = self.launch_process(["printf", "\\377abc\\n"])
+        self.assertEqual(process.log_handler.stdout_lines, ("\ufffdabc",))
+
+
+class TestFunctionDrain(unittest.TestCase):
+    def test_drain(self):
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        buffer = bytearray()
+        os.write(write_fd, b"line 1\nline 2")
+        self.assertFalse(cwatcher._drain(read_fd, buffer))
+        self.assertFalse(cwatcher._drain(read_fd, buffer))
+        self.assertEqual(buffer, b"line 1\nline 2")
+        os.close(write_fd)
+        self.assertTrue(cwatcher._drain(read_fd, buffer))
+        os.close(read_fd)
+
+    def test_drain_one_read(self):
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        buffer = bytearray()
+        try:
+            while True:
+                os.write(write_fd, b"x" * cwatcher.READ_SIZE)
+        except BlockingIOError:
+            pass
+        self.assertFalse(cwatcher._drain(read_fd, buffer))
+        self.assertEqual(len(buffer), cwatcher.READ_SIZE)
+        os.close(write_fd)
+        os.close(read_fd)
+
+
+class WatchTestCase(unittest.TestCase):
+    config_reader: cwatcher.ConfigReader
+
+    @classmethod
+    def setUpClass(cls):
+        # The configuration is only read, so all tests share one reader.
+        cls.config_reader = cwatcher.ConfigReader(
+            spec=cwatcher.CONFIG_READER_SPEC,
+            ini=CONF,
+            dictionary=cwatcher.CONF_DEFAULTS,
+        )
+
+    def watch(self, service_name: str = "test", **kwargs) -> cwatcher.Watch:
+        return cwatcher.Watch(
+            config_reader=self.config_reader, service_name=service_name, **kwargs
+        )
+
+
+class TestClassWatch(WatchTestCase):
+    cmd_stderr = "stderr.sh"
+    cmd_stdout = "stdout.sh"
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        patch_popen(cls)
 
     def test_argument_config_file(self):
         watch = cwatcher.Watch(config_file=CONF, service_name="test")
         self.assertEqual(watch._conf.email.to_addr, "to@example.com")
 
     def test_method_run_output_stdout(self):
-        watch = cwatcher.Watch(config_file=CONF, service_name="test")
+        watch = self.watch()
         with Capturing() as output:
             process = watch.run(self.cmd_stdout)
         self.assertEqual(process.subprocess.returncode, 0)
@@ -441,12 +790,16 @@ class TestClassWatch(unittest.TestCase):
         self.assertIn("One line to stdout!", output[1])
         self.assertIn("Execution time: ", output[2])
 
+    def test_argument_console_batch_size(self):
+        watch = self.watch(console_batch_size=100)
+        with Capturing() as output:
+            watch.run(self.cmd_stdout)
+            self.assertEqual(watch._log_handler._console_pending, [])
+        self.assertEqual(len(output), 3)
+        self.assertIn("One line to stdout!", output[1])
+
     def test_method_run_output_stderr(self):
-        watch = cwatcher.Watch(
-            config_file=CONF,
-            service_name="test",
-            raise_exceptions=False,
-        )
+        watch = self.watch(raise_exceptions=False)
         with Capturing(stream="stderr") as output:
             process = watch.run(self.cmd_stderr)
         self.assertEqual(process.subprocess.returncode, 1)
@@ -457,88 +810,135 @@ class TestClassWatch(unittest.TestCase):
         self.assertIn("One line to stderr!", output.tostring())
 
     def test_method_run_multiple(self):
-        watch = cwatcher.Watch(
-            config_file=CONF, service_name="test", raise_exceptions=False
-        )
+        watch = self.watch(raise_exceptions=False)
         watch.run(self.cmd_stdout)
         watch.run(self.cmd_stderr)
         self.assertEqual(len(watch._log_handler.buffer), 9)
         self.assertIn("Hostname: ", watch._log_handler.all_records)
 
     def test_method_run_log_true(self):
-        watch = cwatcher.Watch(
-            config_file=CONF, service_name="test", raise_exceptions=False
-        )
+        watch = self.watch(raise_exceptions=False)
         process = watch.run(self.cmd_stdout, log=True)
         self.assertEqual(watch.stdout, "One line to stdout!")
         self.assertEqual(process.stdout, "One line to stdout!")
 
     def test_method_run_log_false(self):
-        watch = cwatcher.Watch(
-            config_file=CONF, service_name="test", raise_exceptions=False
-        )
+        watch = self.watch(raise_exceptions=False)
         process = watch.run(self.cmd_stdout, log=False)
         self.assertEqual(watch.stdout, "")
         self.assertEqual(process.stdout, "One line to stdout!")
 
     def test_method_run_kwargs(self):
-        watch = cwatcher.Watch(config_file=CONF, service_name="test")
+        watch = self.watch()
         with mock.patch("subprocess.Popen") as Popen:
             process = Popen.return_value
-            process.stdout = b""
-            process.stderr = b""
+            process.stdout = None
+            process.stderr = None
             process.returncode = 0
             watch.run("ls", cwd="/")
-        Popen.assert_called_with(["ls"], cwd="/", stderr=-1, stdout=-1)
+        Popen.assert_called_with(["ls"], cwd="/", stderr=-1, stdout=-1, bufsize=0)
 
     def test_method_run_kwargs_exception(self):
-        watch = cwatcher.Watch(config_file=CONF, service_name="test")
+        watch = self.watch()
         with self.assertRaises(TypeError):
             watch.run("ls", xxx=False)
 
     def test_property_service_name(self):
-        watch = cwatcher.Watch(config_file=CONF, service_name="Service")
+        watch = self.watch("Service")
         self.assertEqual(watch._service_name, "Service")
 
     def test_property_hostname(self):
-        watch = cwatcher.Watch(config_file=CONF, service_name="test")
+        watch = self.watch()
         self.assertEqual(watch._hostname, cwatcher.HOSTNAME)
 
     def test_property_stdout(self):
-        watch = cwatcher.Watch(config_file=CONF, service_name="test")
+        watch = self.watch()
         watch.log.stdout("stdout")
         self.assertEqual(watch.stdout, "stdout")
 
     def test_property_stderr(self):
-        watch = cwatcher.Watch(config_file=CONF, service_name="test")
+        watch = self.watch()
         watch.log.stderr("stderr")
         self.assertEqual(watch.stderr, "stderr")
 
+    def test_method_log_stdout(self):
+        watch = self.watch()
+        with Capturing() as output:
+            watch.log_stdout("stdout")
+        self.assertEqual(watch.stdout, "stdout")
+        self.assertIn("STDOUT", output[0])
+
+    def test_method_log_stdout_handler_filter(self):
+        watch = self.watch()
+        watch._log_handler.addFilter(lambda record: False)
+        watch.log_stdout("stdout")
+        self.assertEqual(watch.stdout, "")
+
+    def test_method_log_stderr(self):
+        watch = self.watch()
+        with Capturing(stream="stderr") as output:
+            watch.log_stderr("stderr")
+        self.assertEqual(watch.stderr, "stderr")
+        self.assertIn("STDERR", output[0])
+
     def test_propertyprocesses(self):
-        watch = cwatcher.Watch(config_file=CONF, service_name="test")
+        watch = self.watch()
         self.assertEqual(watch.processes, [])
         watch.run(["ls"])
         watch.run(["ls", "-l"])
         watch.run(["ls", "-la"])
         self.assertEqual(len(watch.processes), 3)
 
+    def test_exception(self):
+        watch = self.watch(report_channels=[])
+        with self.assertRaises(cwatcher.CommandWatcherError):
+            watch.run(self.cmd_stderr)
+
+    def test_ignore_exceptions(self):
+        watch = self.watch(report_channels=[])
+        process = watch.run(self.cmd_stderr, ignore_exceptions=[1])
+        self.assertEqual(process.subprocess.returncode, 1)
+
+    def test_ignore_exceptions_raise(self):
+        watch = self.watch(report_channels=[])
+        with self.assertRaises(cwatcher.CommandWatcherError):
+            watch.run("exit-2.sh", ignore_exceptions=[1])
+
+
+class TestClassWatchReport(WatchTestCase):
+    SMTP: mock.MagicMock
+    send_passive_check: mock.MagicMock
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        smtp_patcher = mock.patch("smtplib.SMTP", autospec=True)
+        cls.SMTP = smtp_patcher.start()
+        cls.addClassCleanup(smtp_patcher.stop)
+        check_patcher = mock.patch(
+            "jflib.command_watcher.icinga.send_passive_check", autospec=True
+        )
+        cls.send_passive_check = check_patcher.start()
+        cls.addClassCleanup(check_patcher.stop)
+
+    def tearDown(self):
+        self.SMTP.reset_mock()
+        self.send_passive_check.reset_mock()
+
     def test_method_report_channel_email(self):
-        watch = cwatcher.Watch(config_file=CONF, service_name="my_service")
+        watch = self.watch("my_service")
         watch.log.info("info")
         watch.run("ls")
 
-        with mock.patch("jflib.command_watcher.icinga.send_passive_check"), mock.patch(
-            "smtplib.SMTP"
-        ) as SMTP:
-            watch.report(
-                status=0,
-                custom_message="My message",
-                performance_data={"perf_1": 1, "perf_2": "test"},
-                prefix="",
-            )
+        watch.report(
+            status=0,
+            custom_message="My message",
+            performance_data={"perf_1": 1, "perf_2": "test"},
+            prefix="",
+        )
 
-        SMTP.assert_called_with("smtp.example.com:587")
-        server = SMTP.return_value
+        self.SMTP.assert_called_with("smtp.example.com:587")
+        server = self.SMTP.return_value
         server.login.assert_called_with("Login", "Password")
         call_args = server.sendmail.call_args[0]
         self.assertEqual(call_args[0], "from@example.com")
@@ -546,12 +946,9 @@ class TestClassWatch(unittest.TestCase):
         self.assertIn("From: from@example.com\nTo: to@example.com\n", call_args[2])
 
     def test_method_report_channel_email_critical(self):
-        watch = cwatcher.Watch(config_file=CONF, service_name="my_service")
-        with mock.patch("jflib.command_watcher.icinga.send_passive_check"), mock.patch(
-            "smtplib.SMTP"
-        ) as SMTP:
-            watch.report(status=2)
-        server = SMTP.return_value
+        watch = self.watch("my_service")
+        watch.report(status=2)
+        server = self.SMTP.return_value
         call_args = server.sendmail.call_args[0]
         self.assertEqual(call_args[1], ["critical@example.com"])
         self.assertIn(
@@ -559,17 +956,14 @@ class TestClassWatch(unittest.TestCase):
         )
 
     def test_method_report_channel_nsca(self):
-        watch = cwatcher.Watch(config_file=CONF, service_name="my_service")
-        with mock.patch(
-            "jflib.command_watcher.icinga.send_passive_check"
-        ) as send_passive_check, mock.patch("jflib.command_watcher.send_email"):
-            watch.report(
-                status=0,
-                custom_message="My message",
-                performance_data={"perf_1": 1, "perf_2": "test"},
-                prefix="",
-            )
-        send_passive_check.assert_called_with(
+        watch = self.watch("my_service")
+        watch.report(
+            status=0,
+            custom_message="My message",
+            performance_data={"perf_1": 1, "perf_2": "test"},
+            prefix="",
+        )
+        self.send_passive_check.assert_called_with(
             url="1.2.3.4",
             user="u",
             password=1234,
@@ -594,36 +988,13 @@ class TestClassWatch(unittest.TestCase):
         self.assertIn("status_text: 'OK',", records)
         self.assertIn("user: '[user:{}]'".format(cwatcher.USERNAME), records)
 
-    def test_exception(self):
-        watch = cwatcher.Watch(
-            config_file=CONF, service_name="test", report_channels=[]
-        )
-        with self.assertRaises(cwatcher.CommandWatcherError):
-            watch.run(self.cmd_stderr)
-
-    def test_ignore_exceptions(self):
-        watch = cwatcher.Watch(
-            config_file=CONF, service_name="test", report_channels=[]
-        )
-        process = watch.run(self.cmd_stderr, ignore_exceptions=[1])
-        self.assertEqual(process.subprocess.returncode, 1)
-
-    def test_ignore_exceptions_raise(self):
-        watch = cwatcher.Watch(
-            config_file=CONF, service_name="test", report_channels=[]
-        )
-        with self.assertRaises(cwatcher.CommandWatcherError):
-            watch.run(os.path.join(DIR_FILES, "exit-2.sh"), ignore_exceptions=[1])
 
-
-class TestClassWatchMethodFinalReport(unittest.TestCase):
+class TestClassWatchMethodFinalReport(WatchTestCase):
     def final_report(self, **data):
-        watch = cwatcher.Watch(
-            config_file=CONF, service_name="test", report_channels=[]
-        )
-        watch._timer.result = mock.Mock()
-        watch._timer.result.return_value = "11.123s"
-        return watch.final_report(**data)
+        with mock.patch("time.time", return_value=100.0):
+            watch = self.watch(report_channels=[])
+        with mock.patch("time.time", return_value=111.123):
+            return watch.final_report(**data)
 
     def test_without_arguments(self):
         message = self.final_report()
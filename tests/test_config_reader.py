@@ -1,5 +1,8 @@
 import argparse
+import configparser
+import copy
 import os
+import sys
 import tempfile
 import unittest
 
@@ -13,6 +16,7 @@ from jflib.config_reader import (
     IniReader,
     ReaderBase,
     ReaderSelector,
+    auto_type,
     load_readers_by_keyword,
     validate_key,
 )
@@ -55,6 +59,14 @@ class TestFunctionValidateKey(unittest.TestCase):
         with self.assertRaises(ValueError) as context:
             validate_key("ö")
 
+    def test_invalid_trailing_newline(self):
+        with self.assertRaises(ValueError):
+            validate_key("test\n")
+
+    def test_invalid_empty(self):
+        with self.assertRaises(ValueError):
+            validate_key("")
+
 
 # Reader classes ##############################################################
 
@@ -66,8 +78,8 @@ class FalseReader(ReaderBase):
 
 class TestClassReaderBase(unittest.TestCase):
     def test_exception(self):
-        with self.assertRaises(TypeError):
-            FalseReader()  # pylint: disable=abstract-class-instantiated
+        with self.assertRaises(NotImplementedError):
+            FalseReader().get("section", "key")
 
 
 class TestClassArgparseReader(unittest.TestCase):
@@ -102,6 +114,17 @@ class TestClassArgparseReader(unittest.TestCase):
         with self.assertRaises(ConfigValueError):
             argparse.get("Modern", "name")
 
+    def test_args_without_dict(self):
+        class Args:
+            __slots__ = ("classical_name",)
+
+        args = Args()
+        args.classical_name = "Mozart"
+        argparse = ArgparseReader(args=args)
+        self.assertEqual(argparse.get("Classical", "name"), "Mozart")
+        with self.assertRaises(ConfigValueError):
+            argparse.get("Baroque", "name")
+
 
 class TestClassDictionaryReader(unittest.TestCase):
 
@@ -134,6 +157,15 @@ class TestClassEnvironReader(unittest.TestCase):
             "Environment variable not found: AAA__lol__lol",
         )
 
+    def test_refresh(self):
+        environ = EnvironReader(prefix="AAA")
+        os.environ["AAA__refresh__key"] = "value"
+        with self.assertRaises(ConfigValueError):
+            environ.get("refresh", "key")
+        environ.refresh()
+        self.assertEqual(environ.get("refresh", "key"), "value")
+        del os.environ["AAA__refresh__key"]
+
 
 class TestClassEnvironWithoutPrefix(unittest.TestCase):
     def test_method_get(self):
@@ -152,6 +184,16 @@ class TestClassEnvironWithoutPrefix(unittest.TestCase):
         )
 
 
+class TestClassConfigValueError(unittest.TestCase):
+    def test_lazy_message(self):
+        error = ConfigValueError("section “{}” key “{}”", "a", "b")
+        self.assertEqual(error.args, ("section “{}” key “{}”", "a", "b"))
+        self.assertEqual(str(error), "section “a” key “b”")
+
+    def test_plain_message(self):
+        self.assertEqual(str(ConfigValueError("{}")), "{}")
+
+
 class TestClassIniReader(unittest.TestCase):
     def test_method_get(self):
         ini = IniReader(path=INI_FILE)
@@ -185,6 +227,77 @@ class TestClassIniReader(unittest.TestCase):
         with self.assertRaises(config_reader.IniReaderError):
             IniReader(path="")
 
+    def _write_ini(self, content):
+        path = os.path.join(tempfile.mkdtemp(), "config.ini")
+        with open(path, "w") as ini_file:
+            ini_file.write(content)
+        return path
+
+    def test_parsed_into_dicts(self):
+        ini = IniReader(path=INI_FILE)
+        self.assertEqual(
+            ini._config,
+            {"Classical": {"name": "Mozart"}, "Romantic": {"name": "Schumann"}},
+        )
+
+    def test_same_values_as_strict(self):
+        path = os.path.join(FILES_DIR, "types.ini")
+        fast = IniReader(path)
+        strict = IniReader(path, strict=True)
+        self.assertIsInstance(fast._config, dict)
+        for key in ("int", "str", "dict", "invalid_code", "empty_str", "false_str"):
+            self.assertEqual(fast.get("types", key), strict.get("types", key))
+
+    def test_comments_and_case(self):
+        ini = IniReader(
+            self._write_ini("# comment\n[Section]\n; comment\nKey: value\n")
+        )
+        self.assertEqual(ini.get("Section", "key"), "value")
+        self.assertEqual(ini.get("Section", "KEY"), "value")
+
+    def test_fallback_interpolation(self):
+        ini = IniReader(self._write_ini("[section]\na = 1\nb = %(a)s2\n"))
+        self.assertIsInstance(ini._config, dict)
+        self.assertEqual(ini.get("section", "b"), "12")
+
+    def test_fallback_default_section(self):
+        ini = IniReader(self._write_ini("[DEFAULT]\na = 1\n[section]\nb = 2\n"))
+        self.assertEqual(ini.get("section", "a"), "1")
+        self.assertEqual(ini.get("DEFAULT", "a"), "1")
+
+    def test_fallback_default_section_interpolation(self):
+        ini = IniReader(self._write_ini("[DEFAULT]\nbase = /x\np = %(base)s/y\n"))
+        self.assertEqual(ini.get("DEFAULT", "p"), "/x/y")
+
+    def test_fallback_bad_interpolation(self):
+        ini = IniReader(self._write_ini("[section]\na = 1\nb = %(c)s\n"))
+        self.assertIsInstance(ini._config, configparser.ConfigParser)
+        self.assertEqual(ini.get("section", "a"), "1")
+        with self.assertRaises(configparser.InterpolationError):
+            ini.get("section", "b")
+
+    def test_missing_section_header(self):
+        path = self._write_ini("no section\n")
+        with self.assertRaises(configparser.MissingSectionHeaderError):
+            IniReader(path)
+
+    def test_duplicate_option(self):
+        path = self._write_ini("[section]\nkey = one\nkey = two\n")
+        with self.assertRaises(configparser.DuplicateOptionError):
+            IniReader(path)
+
+    def test_cache(self):
+        path = self._write_ini("[section]\nkey = one\n")
+        self.assertIs(IniReader(path)._config, IniReader(path)._config)
+        os.utime(path, ns=(0, 0))
+        with open(path, "a") as ini_file:
+            ini_file.write("other = two\n")
+        self.assertEqual(IniReader(path).get("section", "other"), "two")
+
+    def test_fallback_continuation(self):
+        ini = IniReader(self._write_ini("[section]\nkey = one\n  two\n"))
+        self.assertEqual(ini.get("section", "key"), "one\ntwo")
+
 
 # Common code #################################################################
 
@@ -207,6 +320,36 @@ class TestClassReaderSelector(unittest.TestCase):
             "Configuration value could not be found (section “lol” key " "“lol”).",
         )
 
+    def test_cache(self):
+        reader = ReaderSelector(DictionaryReader({"section": {"key": "value"}}))
+        self.assertEqual(reader.get("section", "key"), "value")
+        reader.readers = ()
+        self.assertEqual(reader.get("section", "key"), "value")
+
+    def test_cache_missing(self):
+        dictionary = {"section": {}}
+        reader = ReaderSelector(DictionaryReader(dictionary))
+        with self.assertRaises(ValueError):
+            reader.get("section", "key")
+        dictionary["section"]["key"] = "value"
+        with self.assertRaises(ValueError):
+            reader.get("section", "key")
+        reader.invalidate("section", "key")
+        self.assertEqual(reader.get("section", "key"), "value")
+
+    def test_method_invalidate(self):
+        dictionary = {"a": {"key": 1}, "b": {"key": 2}}
+        reader = ReaderSelector(DictionaryReader(dictionary))
+        reader.get("a", "key")
+        reader.get("b", "key")
+        dictionary["a"]["key"] = 3
+        dictionary["b"]["key"] = 4
+        reader.invalidate("a")
+        self.assertEqual(reader.get("a", "key"), 3)
+        self.assertEqual(reader.get("b", "key"), 2)
+        reader.invalidate()
+        self.assertEqual(reader.get("b", "key"), 4)
+
 
 class TestFunctionLoadReadersByKeyword(unittest.TestCase):
     def test_without_keywords_arguments(self):
@@ -342,6 +485,46 @@ class TestClassConfigReader(unittest.TestCase):
         self.assertEqual(config.specific.environ, "environ")
         self.assertEqual(config.specific.ini, "ini")
 
+    def test_slots(self):
+        config_reader = ConfigReader(environ=self.environ, ini=self.ini)
+        config = config_reader.get_class_interface()
+        for obj in (config, config.specific, *config_reader.reader.readers):
+            with self.assertRaises(AttributeError):
+                obj.unknown_attribute = True
+
+    def test_interface_sections_cached(self):
+        config_reader = ConfigReader(ini=self.ini)
+        config = config_reader.get_class_interface()
+        self.assertIs(config.specific, config.specific)
+        dictionary = config_reader.get_dictionary_interface()
+        self.assertIs(dictionary["specific"], dictionary["specific"])
+
+    def test_method_invalidate(self):
+        dictionary = {"section": {"key": "old"}}
+        config_reader = ConfigReader(dictionary=dictionary)
+        config = config_reader.get_class_interface()
+        self.assertEqual(config.section.key, "old")
+        dictionary["section"]["key"] = "new"
+        self.assertEqual(config.section.key, "old")
+        config_reader.invalidate("section")
+        self.assertEqual(config.section.key, "new")
+
+    def test_method_invalidate_environ(self):
+        config_reader = ConfigReader(environ="ZZZ")
+        config = config_reader.get_class_interface()
+        os.environ["ZZZ__section__key"] = "value"
+        with self.assertRaises(ValueError):
+            config.section.key
+        config_reader.invalidate()
+        self.assertEqual(config.section.key, "value")
+        del os.environ["ZZZ__section__key"]
+
+    def test_class_interface_special_names(self):
+        config = ConfigReader(ini=self.ini).get_class_interface()
+        self.assertFalse(hasattr(config, "__deepcopy__"))
+        self.assertFalse(hasattr(config.specific, "__deepcopy__"))
+        self.assertEqual(copy.copy(config).specific.ini, "ini")
+
     def test_method_get_dictionary_interface(self):
         config_reader = ConfigReader(
             argparse=self.argparse,
@@ -420,6 +603,16 @@ class TestClassConfigReader(unittest.TestCase):
         self.assertEqual(config.no_default.key, "No default value")
         self.assertEqual(config.default.key, 123)
 
+    def test_spec_interfaces(self):
+        spec = {"default": {"key": {"default": 123}}}
+        config_reader = ConfigReader(spec=spec)
+        config = config_reader.get_class_interface()
+        self.assertIs(config, config_reader.get_class_interface())
+        self.assertEqual(list(config._sections), ["default"])
+        dictionary = config_reader.get_dictionary_interface()
+        self.assertIs(dictionary, config_reader.get_dictionary_interface())
+        self.assertEqual(dictionary["default"]["key"], 123)
+
     def test_method_spec_to_argparse(self):
         spec = {
             "email": {
@@ -438,6 +631,41 @@ class TestClassConfigReader(unittest.TestCase):
         self.assertEqual(args.email_smtp_login, "user2")
 
 
+class TestFunctionAutoType(unittest.TestCase):
+    def test_int(self):
+        self.assertEqual(auto_type("123"), 123)
+        self.assertEqual(auto_type("-1"), -1)
+        self.assertEqual(auto_type("0"), 0)
+
+    def test_no_literal(self):
+        self.assertEqual(auto_type(""), "")
+        self.assertEqual(auto_type("/usr/local/bin"), "/usr/local/bin")
+        self.assertEqual(auto_type("hello"), "hello")
+        self.assertEqual(auto_type("rb'x'"), b"x")
+
+    def test_int_too_long(self):
+        limit = getattr(sys, "get_int_max_str_digits", lambda: 0)()
+        if not limit:
+            self.skipTest("no integer string conversion length limit")
+        value = "1" * (limit + 1)
+        self.assertEqual(auto_type(value), value)
+
+    def test_leading_zeros(self):
+        self.assertEqual(auto_type("007"), "007")
+
+    def test_float(self):
+        self.assertEqual(auto_type("-1.5"), -1.5)
+        self.assertEqual(auto_type("1.5e3"), 1500.0)
+
+    def test_no_str(self):
+        self.assertEqual(auto_type(1), 1)
+
+    def test_cached_list_not_shared(self):
+        value = auto_type("[1, 2]")
+        value.append(3)
+        self.assertEqual(auto_type("[1, 2]"), [1, 2])
+
+
 class TestTypes(unittest.TestCase):
     def setUp(self):
         config_reader = ConfigReader(ini=os.path.join(FILES_DIR, "types.ini"))
@@ -1,7 +1,7 @@
 import unittest
 from unittest import mock
 
-from jflib.send_email import send_email
+from jflib.send_email import SMTPMailer, send_email
 
 
 class TestSendEmail(unittest.TestCase):
@@ -24,3 +24,22 @@ class TestSendEmail(unittest.TestCase):
         self.assertEqual(call_args[0], "from@example.com")
         self.assertEqual(call_args[1], ["to@example.com"])
         self.assertIn("From: from@example.com\nTo: to@example.com\n", call_args[2])
+
+
+class TestSMTPMailer(unittest.TestCase):
+    def test_send_several(self):
+        with mock.patch("smtplib.SMTP") as SMTP:
+            with SMTPMailer("Login", "Password", "smtp.example.com:587") as mailer:
+                mailer.send("from@example.com", "one@example.com", "One", "1")
+                mailer.send("from@example.com", "two@example.com", "Two", "2")
+
+        SMTP.assert_called_once_with("smtp.example.com:587")
+        server = SMTP.return_value
+        server.login.assert_called_once_with("Login", "Password")
+        self.assertEqual(server.sendmail.call_count, 2)
+        server.quit.assert_called_once_with()
+
+    def test_without_context_manager(self):
+        mailer = SMTPMailer("Login", "Password", "smtp.example.com:587")
+        with self.assertRaises(RuntimeError):
+            mailer.send("from@example.com", "to@example.com", "Subject", "Body")
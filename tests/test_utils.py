@@ -3,7 +3,7 @@ import stat
 import tempfile
 import unittest
 
-from jflib.utils import download, make_executable
+from jflib.utils import download, make_executable, make_executable_many
 
 
 class TestUtils(unittest.TestCase):
@@ -32,3 +32,13 @@ class TestUtils(unittest.TestCase):
 
         make_executable(tmp_file)
         self.assertTrue(stat.S_IXUSR & os.stat(tmp_file)[stat.ST_MODE])
+
+    def test_make_executable_many(self):
+        paths = [tempfile.mkstemp()[1] for _ in range(2)]
+        make_executable_many(paths)
+        for path in paths:
+            self.assertTrue(stat.S_IXUSR & os.stat(path)[stat.ST_MODE])
+
+        make_executable_many(paths, mode=0o755)
+        for path in paths:
+            self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o755)